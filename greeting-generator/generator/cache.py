@@ -0,0 +1,145 @@
+"""
+Disk Cache for Daily Greeting Generator
+
+Small JSON file cache with per-entry time-to-live, used for data that rarely
+changes between runs (e.g. the weather.gov grid lookup for fixed coordinates).
+"""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+from . import fastjson
+
+# Cache location (persists across runs and deployments)
+CACHE_DIR = Path.home() / ".cache" / "daily_greeting"
+
+
+def _write_atomic(path, data):
+    """
+    Write bytes to path via a temporary file and an atomic rename.
+
+    Readers (and concurrent writers) never see a partially written entry.
+    The temp name is unique per process and thread so parallel saves of the
+    same entry don't clobber each other's temp file.
+
+    Args:
+        path: Destination file path
+        data: Bytes to write
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def load_cache(name, max_age):
+    """
+    Load a cached value if it exists and is still fresh.
+
+    Freshness is judged by the cache file's modification time.
+
+    Args:
+        name: Cache entry name (file stem under CACHE_DIR)
+        max_age: Maximum entry age in seconds
+
+    Returns:
+        object: Cached JSON value, or None if missing, expired, or unreadable
+    """
+    path = CACHE_DIR / f"{name}.json"
+
+    try:
+        age = time.time() - path.stat().st_mtime
+        if age > max_age:
+            logging.debug(f"Cache entry '{name}' expired ({age:.0f}s old)")
+            return None
+
+        with open(path, 'rb') as f:
+            value = fastjson.loads(f.read())
+        logging.debug(f"Cache hit for '{name}'")
+        return value
+
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logging.warning(f"Failed to read cache entry '{name}': {e}")
+        return None
+
+
+def save_cache(name, value):
+    """
+    Save a JSON-serializable value to the cache.
+
+    Args:
+        name: Cache entry name (file stem under CACHE_DIR)
+        value: JSON-serializable value to store
+
+    Returns:
+        bool: True if saved, False on failure
+    """
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _write_atomic(CACHE_DIR / f"{name}.json", fastjson.dumps(value).encode('utf-8'))
+        logging.debug(f"Saved cache entry '{name}'")
+        return True
+
+    except Exception as e:
+        logging.warning(f"Failed to save cache entry '{name}': {e}")
+        return False
+
+
+def load_cache_bytes(name, max_age):
+    """
+    Load a cached binary blob if it exists and is still fresh.
+
+    Args:
+        name: Cache entry name (file stem under CACHE_DIR)
+        max_age: Maximum entry age in seconds
+
+    Returns:
+        bytes: Cached data, or None if missing, expired, or unreadable
+    """
+    path = CACHE_DIR / f"{name}.bin"
+
+    try:
+        age = time.time() - path.stat().st_mtime
+        if age > max_age:
+            logging.debug(f"Cache entry '{name}' expired ({age:.0f}s old)")
+            return None
+
+        data = path.read_bytes()
+        logging.debug(f"Cache hit for '{name}'")
+        return data
+
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logging.warning(f"Failed to read cache entry '{name}': {e}")
+        return None
+
+
+def save_cache_bytes(name, data):
+    """
+    Save a binary blob to the cache.
+
+    Args:
+        name: Cache entry name (file stem under CACHE_DIR)
+        data: Bytes to store
+
+    Returns:
+        bool: True if saved, False on failure
+    """
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _write_atomic(CACHE_DIR / f"{name}.bin", data)
+        logging.debug(f"Saved cache entry '{name}'")
+        return True
+
+    except Exception as e:
+        logging.warning(f"Failed to save cache entry '{name}': {e}")
+        return False
@@ -5,6 +5,7 @@ Loads settings from config.ini file with fallback to module defaults.
 """
 
 import configparser
+import functools
 import logging
 from pathlib import Path
 
@@ -14,13 +15,26 @@ def load_config(base_dir):
     Load configuration from config.ini file.
 
     Reads config.ini from project root and returns all settings as a
-    flat dictionary with dot-notation keys (e.g., "weather.lat").
+    flat dictionary with dot-notation keys (e.g., "weather.lat"). The file
+    is parsed once per process; later calls return the cached result.
 
     Returns:
         dict: Configuration values as {"section.key": "value"}, or empty dict if no config file
     """
-    config_path = Path(base_dir) / "config.ini"
+    return _read_config(Path(base_dir).resolve() / "config.ini")
 
+
+@functools.lru_cache(maxsize=None)
+def _read_config(config_path):
+    """
+    Parse and flatten a config.ini file (memoized by resolved path).
+
+    Args:
+        config_path: Absolute Path to config.ini
+
+    Returns:
+        dict: Configuration values as {"section.key": "value"}, or empty dict if no config file
+    """
     if not config_path.exists():
         return {}
 
@@ -37,64 +51,102 @@ def load_config(base_dir):
     return config_dict
 
 
-def apply_config(config_dict):
+def _to_bool(value):
     """
-    Apply configuration values to module constants.
-
-    Updates constants in data_sources, llm, tts, and io_manager modules
-    based on loaded configuration.
+    Convert an INI boolean string the way configparser.getboolean() does.
 
     Args:
-        config_dict: Dictionary from load_config() with dot-notation keys
+        value: Raw config value (e.g. "true", "no", "1", "off")
+
+    Returns:
+        bool: Parsed value
+
+    Raises:
+        ValueError: If the value is not a recognized boolean
     """
-    if not config_dict:
-        logging.info("No config file found, using defaults")
-        return
+    try:
+        return configparser.ConfigParser.BOOLEAN_STATES[value.strip().lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value}")
 
-    from . import data_sources, llm, tts, pipeline
 
+# Config key -> (module name, constant name, type converter)
+CONFIG_TABLE = {
     # Weather configuration
-    if "weather.lat" in config_dict:
-        data_sources.LAT = float(config_dict["weather.lat"])
-    if "weather.lon" in config_dict:
-        data_sources.LON = float(config_dict["weather.lon"])
-    if "weather.user_agent" in config_dict:
-        data_sources.USER_AGENT = config_dict["weather.user_agent"]
+    "weather.lat": ("data_sources", "LAT", float),
+    "weather.lon": ("data_sources", "LON", float),
+    "weather.user_agent": ("data_sources", "USER_AGENT", str),
+    "weather.forecast_url": ("data_sources", "FORECAST_URL", str),
+    "weather.forecast_hourly_url": ("data_sources", "FORECAST_HOURLY_URL", str),
 
     # Ollama configuration
-    if "ollama.base_url" in config_dict:
-        llm.OLLAMA_BASE = config_dict["ollama.base_url"]
-    if "ollama.model" in config_dict:
-        llm.MODEL = config_dict["ollama.model"]
-    if "ollama.image_model" in config_dict:
-        llm.IMAGE_MODEL = config_dict["ollama.image_model"]
+    "ollama.base_url": ("llm", "OLLAMA_BASE", str),
+    "ollama.model": ("llm", "MODEL", str),
+    "ollama.image_model": ("llm", "IMAGE_MODEL", str),
+    "ollama.cache_ttl": ("llm", "OLLAMA_CACHE_TTL", int),
+    "ollama.vision_cache_ttl": ("llm", "VISION_CACHE_TTL", int),
+    "ollama.keep_alive": ("llm", "KEEP_ALIVE", str),
+    "ollama.keep_models_loaded": ("llm", "KEEP_MODELS_LOADED", _to_bool),
+    "ollama.num_ctx_small": ("llm", "NUM_CTX_SMALL", int),
+    "ollama.num_ctx_large": ("llm", "NUM_CTX_LARGE", int),
 
     # Navidrome configuration
-    if "navidrome.base_url" in config_dict:
-        data_sources.NAVIDROME_BASE = config_dict["navidrome.base_url"]
-    if "navidrome.username" in config_dict:
-        data_sources.NAVIDROME_USER = config_dict["navidrome.username"]
-    if "navidrome.password" in config_dict:
-        data_sources.NAVIDROME_PASS = config_dict["navidrome.password"]
-    if "navidrome.client_name" in config_dict:
-        data_sources.NAVIDROME_CLIENT = config_dict["navidrome.client_name"]
+    "navidrome.base_url": ("data_sources", "NAVIDROME_BASE", str),
+    "navidrome.username": ("data_sources", "NAVIDROME_USER", str),
+    "navidrome.password": ("data_sources", "NAVIDROME_PASS", str),
+    "navidrome.client_name": ("data_sources", "NAVIDROME_CLIENT", str),
 
     # Literature configuration
-    if "literature.length" in config_dict:
-        data_sources.LITERATURE_LENGTH = int(config_dict["literature.length"])
-    if "literature.padding" in config_dict:
-        data_sources.LITERATURE_PADDING = int(config_dict["literature.padding"])
+    "literature.length": ("data_sources", "LITERATURE_LENGTH", int),
+    "literature.padding": ("data_sources", "LITERATURE_PADDING", int),
+    "literature.max_bytes": ("data_sources", "LITERATURE_MAX_BYTES", int),
+    "literature.batch_size": ("pipeline", "LITERATURE_BATCH_SIZE", int),
 
     # Composition configuration
-    if "composition.mean_length" in config_dict:
-        pipeline.MESSAGE_MEAN_LEN = int(config_dict["composition.mean_length"])
-    if "composition.q1_length" in config_dict:
-        pipeline.MESSAGE_Q1_LEN = int(config_dict["composition.q1_length"])
-    if "composition.min_length" in config_dict:
-        pipeline.MESSAGE_MIN_LEN = int(config_dict["composition.min_length"])
-
-    # TTS configuration
-    if "tts.length_scale" in config_dict:
-        tts.LENGTH_SCALE = float(config_dict["tts.length_scale"])
-
-    logging.info(f"Applied {len(config_dict)} configuration overrides")
+    "composition.mean_length": ("pipeline", "MESSAGE_MEAN_LEN", int),
+    "composition.q1_length": ("pipeline", "MESSAGE_Q1_LEN", int),
+    "composition.min_length": ("pipeline", "MESSAGE_MIN_LEN", int),
+
+    # TTS and playback configuration
+    "tts.length_scale": ("tts", "LENGTH_SCALE", float),
+    "tts.half_precision": ("tts", "HALF_PRECISION", _to_bool),
+    "tts.allow_cpu": ("tts", "ALLOW_CPU", _to_bool),
+    "playback.server_url": ("tts", "SERVER_ADDR", str),
+}
+
+
+def apply_config(config_dict):
+    """
+    Apply configuration values to module constants.
+
+    Updates constants in data_sources, llm, tts, and pipeline modules
+    based on loaded configuration, as mapped by CONFIG_TABLE.
+
+    Args:
+        config_dict: Dictionary from load_config() with dot-notation keys
+    """
+    if not config_dict:
+        logging.info("No config file found, using defaults")
+        return
+
+    from . import data_sources, llm, tts, pipeline
+
+    modules = {
+        "data_sources": data_sources,
+        "llm": llm,
+        "tts": tts,
+        "pipeline": pipeline,
+    }
+
+    applied = 0
+    for key, value in config_dict.items():
+        target = CONFIG_TABLE.get(key)
+        if target is None:
+            logging.debug(f"Ignoring unknown config key '{key}'")
+            continue
+
+        module_name, attr, convert = target
+        setattr(modules[module_name], attr, convert(value))
+        applied += 1
+
+    logging.info(f"Applied {applied} configuration overrides")
@@ -7,28 +7,157 @@ Fetches data from external APIs:
 - Music metadata from Navidrome server (Subsonic API)
 """
 
-import requests
 from urllib.parse import quote
-import base64
+import hashlib
 import random
-import re
 import logging
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from . import fastjson
+from .session import SESSION, DEFAULT_TIMEOUT
+from .cache import load_cache, save_cache, load_cache_bytes, save_cache_bytes
 
 # Weather.gov API configuration
 LAT = 42.27
 LON = -71.81
 USER_AGENT = "DailyGreeting/1.0"
+POINTS_CACHE_TTL = 30 * 24 * 60 * 60  # Grid lookup is static for fixed coordinates
+FORECAST_CACHE_TTL = 30 * 60  # Forecasts update roughly hourly
+FORECAST_URL = None  # Optional pre-resolved grid URLs (skip the /points lookup)
+FORECAST_HOURLY_URL = None
 
 # Navidrome server configuration
 NAVIDROME_BASE = "http://192.168.1.134:4533"
 NAVIDROME_USER = "username"
 NAVIDROME_PASS = "password"
 NAVIDROME_CLIENT = "DailyGreeting"
+COVERART_CACHE_TTL = 30 * 24 * 60 * 60  # Cover art for a given ID never changes
 
 # Literature excerpt parameters
 LITERATURE_LENGTH = 600
 LITERATURE_PADDING = 2000
+GUTENDEX_CACHE_TTL = 7 * 24 * 60 * 60  # Catalog listing pages change slowly
+BOOK_POOL_PAGES = 5  # Gutendex pages sampled when rebuilding the local book pool
+BOOK_PICK_ATTEMPTS = 3  # Books tried from the pool before giving up on a call
+LITERATURE_MAX_BYTES = 2 * 1024 * 1024  # Stop downloading very long books past this size
+
+# Serializes book pool rebuilds, so concurrent literature fetches on a cold cache
+# rebuild (and save) the pool once instead of once per thread
+_book_pool_lock = threading.Lock()
+
+# Project Gutenberg header/footer markers (e.g. "*** START OF THE PROJECT GUTENBERG EBOOK ... ***")
+GUT_START_MARKER = "*** START OF "
+GUT_END_MARKER = "*** END OF "
+GUT_MARKER_SUFFIXES = ("THE PROJECT GUTENBERG", "THIS PROJECT GUTENBERG")
+BOOK_CHUNK_SIZE = 64 * 1024  # Streaming read size for book downloads
+
+
+def _trim_gutenberg_boilerplate(text):
+    """
+    Strip the Project Gutenberg license header and footer from a book.
+
+    Uses plain substring search rather than regex, since the markers are
+    literal and book bodies can be several megabytes.
+
+    Args:
+        text: Full book text
+
+    Returns:
+        str: Text between the START and END markers (unchanged if markers are absent)
+    """
+    # Header: first START marker, trimmed through its closing asterisks
+    pos = text.find(GUT_START_MARKER)
+    while pos != -1:
+        if text.startswith(GUT_MARKER_SUFFIXES, pos + len(GUT_START_MARKER)):
+            close = text.find("***", pos + len(GUT_START_MARKER))
+            if close != -1:
+                text = text[close + 3:]
+            break
+        pos = text.find(GUT_START_MARKER, pos + 1)
+
+    # Footer: first END marker after the header
+    pos = text.find(GUT_END_MARKER)
+    while pos != -1:
+        if text.startswith(GUT_MARKER_SUFFIXES, pos + len(GUT_END_MARKER)):
+            text = text[:pos]
+            break
+        pos = text.find(GUT_END_MARKER, pos + 1)
+
+    return text
+
+
+def _download_book_text(url):
+    """
+    Stream a plain text book, stopping at the Gutenberg END marker or byte cap.
+
+    The license footer after the END marker is never downloaded, books longer
+    than LITERATURE_MAX_BYTES are cut off early (still plenty for an excerpt
+    and the Jabberwocky model), and the body is decoded once from raw bytes
+    instead of through response.text.
+
+    Args:
+        url: Plain text book URL
+
+    Returns:
+        str: Decoded book text up to the END marker or byte cap, or None on HTTP error
+    """
+    end_markers = [(GUT_END_MARKER + suffix).encode('ascii') for suffix in GUT_MARKER_SUFFIXES]
+    overlap = max(len(marker) for marker in end_markers)
+
+    with SESSION.get(url, stream=True, timeout=DEFAULT_TIMEOUT) as response:
+        if response.status_code != 200:
+            logging.error(f"Failed to fetch book text (status {response.status_code})")
+            return None
+
+        buffer = bytearray()
+        for chunk in response.iter_content(chunk_size=BOOK_CHUNK_SIZE):
+            # Only rescan the new chunk plus enough overlap for a marker split across chunks
+            search_from = max(0, len(buffer) - overlap)
+            buffer += chunk
+
+            end_positions = [pos for pos in (buffer.find(marker, search_from) for marker in end_markers) if pos != -1]
+            if end_positions:
+                del buffer[min(end_positions):]
+                break
+
+            if len(buffer) >= LITERATURE_MAX_BYTES:
+                logging.debug(f"Book exceeds {LITERATURE_MAX_BYTES} bytes, stopping download early")
+                del buffer[LITERATURE_MAX_BYTES:]
+                break
+
+        encoding = response.encoding or 'utf-8'
+
+    return buffer.decode(encoding, errors='replace')
+
+
+def _get_json_cached(url, max_age, headers=None):
+    """
+    GET a JSON API response, serving it from the disk cache while fresh.
+
+    Only successful responses are cached; errors are always re-fetched.
+
+    Args:
+        url: Request URL (used as the cache key)
+        max_age: Maximum cached response age in seconds
+        headers: Optional request headers
+
+    Returns:
+        tuple: (status_code, parsed JSON or None on non-200 status)
+    """
+    cache_name = "http_" + hashlib.sha1(url.encode('utf-8')).hexdigest()
+    data = load_cache(cache_name, max_age)
+    if data is not None:
+        return 200, data
+
+    response = SESSION.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
+    if response.status_code != 200:
+        return response.status_code, None
+
+    data = fastjson.loads(response.content)
+    save_cache(cache_name, data)
+    return 200, data
 
 
 def get_weather_data():
@@ -42,39 +171,55 @@ def get_weather_data():
         start_time = time.time()
         logging.info("Fetching weather data from weather.gov API")
 
-        # Convert latitude and longitude to NWS grid coordinates
-        points_url = f"https://api.weather.gov/points/{LAT},{LON}"
-        points_response = requests.get(points_url, headers={"User-Agent": USER_AGENT})
-        logging.debug(f"Points API call took {time.time() - start_time:.2f}s")
-
-        if points_response.status_code != 200:
-            logging.error(f"Weather.gov points API returned status {points_response.status_code}")
-            return None
+        # Grid mapping for fixed coordinates is static, so prefer configured or cached URLs
+        points_cache_name = f"points_{LAT}_{LON}"
+        if FORECAST_URL and FORECAST_HOURLY_URL:
+            grid = {"forecast": FORECAST_URL, "forecastHourly": FORECAST_HOURLY_URL}
+            logging.debug("Using configured NWS grid forecast URLs")
+        else:
+            grid = load_cache(points_cache_name, POINTS_CACHE_TTL)
+            if grid:
+                logging.debug("Using cached NWS grid forecast URLs")
+
+        if not grid:
+            # Convert latitude and longitude to NWS grid coordinates
+            points_url = f"https://api.weather.gov/points/{LAT},{LON}"
+            points_response = SESSION.get(points_url, headers={"User-Agent": USER_AGENT}, timeout=DEFAULT_TIMEOUT)
+            logging.debug(f"Points API call took {time.time() - start_time:.2f}s")
+
+            if points_response.status_code != 200:
+                logging.error(f"Weather.gov points API returned status {points_response.status_code}")
+                return None
+
+            points_data = fastjson.loads(points_response.content)
+            grid = {
+                "forecast": points_data["properties"]["forecast"],
+                "forecastHourly": points_data["properties"]["forecastHourly"]
+            }
+            save_cache(points_cache_name, grid)
 
-        points_data = points_response.json()
-        forecast_url = points_data["properties"]["forecast"]
-        forecast_hourly_url = points_data["properties"]["forecastHourly"]
+        forecast_url = grid["forecast"]
+        forecast_hourly_url = grid["forecastHourly"]
         logging.debug(f"Forecast URLs: {forecast_url}, {forecast_hourly_url}")
 
-        # Fetch forecast data
+        # Fetch daily and hourly forecasts concurrently (independent requests)
         forecast_start = time.time()
-        forecast_response = requests.get(forecast_url, headers={"User-Agent": USER_AGENT})
-        hourly_response = requests.get(forecast_hourly_url, headers={"User-Agent": USER_AGENT})
+        headers = {"User-Agent": USER_AGENT}
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            forecast_future = executor.submit(_get_json_cached, forecast_url, FORECAST_CACHE_TTL, headers)
+            hourly_future = executor.submit(_get_json_cached, forecast_hourly_url, FORECAST_CACHE_TTL, headers)
+            forecast_status, forecast_data = forecast_future.result()
+            hourly_status, hourly_data = hourly_future.result()
         logging.debug(f"Forecast API calls took {time.time() - forecast_start:.2f}s")
 
-        if forecast_response.status_code != 200 or hourly_response.status_code != 200:
-            logging.error(f"Weather.gov forecast API error (daily: {forecast_response.status_code}, hourly: {hourly_response.status_code})")
+        if forecast_status != 200 or hourly_status != 200:
+            logging.error(f"Weather.gov forecast API error (daily: {forecast_status}, hourly: {hourly_status})")
             return None
 
-        forecast_data = forecast_response.json()
-        hourly_data = hourly_response.json()
-
         # Find first daytime hour for sunrise conditions
-        sunrise_hour = None
-        for hour in hourly_data["properties"]["periods"]:
-            if hour['isDaytime']:
-                sunrise_hour = hour
-                break
+        # Only the next 24 hours can contain the upcoming sunrise
+        periods = hourly_data["properties"]["periods"][:24]
+        sunrise_hour = next((hour for hour in periods if hour['isDaytime']), None)
 
         if not sunrise_hour:
             logging.warning("No daytime hours found in forecast data")
@@ -114,11 +259,84 @@ def get_weather_data():
         return None
 
 
+def _get_book_pool():
+    """
+    Load the local pool of candidate books, rebuilding it from Gutendex when stale.
+
+    The pool samples several random Gutendex listing pages (exponential distribution,
+    favoring lower page numbers) and keeps only books with a plain text format, so
+    steady-state runs pick a book without any catalog request.
+
+    Returns:
+        list: Book dicts with 'id', 'title', 'authors', 'text_url' keys (empty on failure)
+    """
+    pool = load_cache("book_pool", GUTENDEX_CACHE_TTL)
+    if pool:
+        logging.debug(f"Using cached book pool ({len(pool)} books)")
+        return pool
+
+    with _book_pool_lock:
+        # Another thread may have rebuilt the pool while this one waited for the lock
+        pool = load_cache("book_pool", GUTENDEX_CACHE_TTL)
+        if pool:
+            logging.debug(f"Using book pool rebuilt by another thread ({len(pool)} books)")
+            return pool
+
+        return _rebuild_book_pool()
+
+
+def _rebuild_book_pool():
+    """
+    Rebuild the book pool from Gutendex listing pages and save it to the cache.
+
+    Callers must hold _book_pool_lock.
+
+    Returns:
+        list: Book dicts with 'id', 'title', 'authors', 'text_url' keys (empty on failure)
+    """
+    pages = sorted({int(random.expovariate(0.05)) + 1 for _ in range(BOOK_POOL_PAGES)})
+    logging.info(f"Rebuilding book pool from Gutendex (pages {pages})")
+
+    urls = [f"https://gutendex.com/books/?languages=en&page={page}" for page in pages]
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        results = list(executor.map(lambda url: _get_json_cached(url, GUTENDEX_CACHE_TTL), urls))
+
+    pool = []
+    for page, (status, data) in zip(pages, results):
+        if status != 200:
+            logging.warning(f"Gutendex API returned status {status} for page {page}")
+            continue
+
+        for book in data.get('results', []):
+            formats = book.get('formats', {})
+            text_url = (formats.get('text/plain; charset=utf-8') or
+                        formats.get('text/plain; charset=us-ascii') or
+                        formats.get('text/plain'))
+
+            if not text_url:
+                logging.debug(f"Skipping book without plain text format (ID: {book['id']})")
+                continue
+
+            pool.append({
+                "id": book['id'],
+                "title": book['title'],
+                "authors": book.get('authors', []),
+                "text_url": text_url
+            })
+
+    if pool:
+        save_cache("book_pool", pool)
+        logging.debug(f"Book pool rebuilt with {len(pool)} books")
+
+    return pool
+
+
 def get_random_literature(length=LITERATURE_LENGTH, padding=LITERATURE_PADDING):
     """
     Retrieve a random excerpt from an English book using the Gutendex API.
 
-    Uses exponential distribution to select random page, avoiding unreliable ID guessing.
+    Picks from a locally cached pool of books sampled from random Gutendex pages,
+    avoiding unreliable ID guessing and a catalog request on every call.
 
     Args:
         length: Target length of excerpt in characters
@@ -129,53 +347,40 @@ def get_random_literature(length=LITERATURE_LENGTH, padding=LITERATURE_PADDING):
     """
     try:
         start_time = time.time()
-        # Select random page using exponential distribution (favors lower page numbers)
-        random_page = int(random.expovariate(0.05)) + 1
-        logging.info(f"Fetching literature from Gutendex (page {random_page})")
-
-        api_url = f"https://gutendex.com/books/?languages=en&page={random_page}"
-        response = requests.get(api_url)
-        logging.debug(f"Gutendex API call took {time.time() - start_time:.2f}s")
-
-        if response.status_code != 200:
-            logging.error(f"Gutendex API returned status {response.status_code}")
-            return None, None
+        logging.info("Fetching literature from Gutendex")
 
-        data = response.json()
-        books = data.get('results', [])
+        books = _get_book_pool()
+        logging.debug(f"Book pool lookup took {time.time() - start_time:.2f}s")
 
         if not books:
-            logging.warning(f"No books found on Gutendex page {random_page}")
+            logging.error("No books available from Gutendex")
             return None, None
 
-        logging.debug(f"Found {len(books)} books on page {random_page}")
-
-        # Select random book and check for plain text format
-        book = random.choice(books)
-        formats = book.get('formats', {})
-        book_id = book['id']
-        title = book['title']
-
-        text_url = (formats.get('text/plain; charset=utf-8') or
-                    formats.get('text/plain; charset=us-ascii') or
-                    formats.get('text/plain'))
-
-        if not text_url:
-            logging.warning(f"No plain text format for book '{title}' (ID: {book_id})")
-            return None, None
+        # Try a few distinct random books so a failed download or short text
+        # doesn't cost the caller a whole validation attempt
+        text = None
+        for book in random.sample(books, min(BOOK_PICK_ATTEMPTS, len(books))):
+            title = book['title']
+            logging.info(f"Fetching text for '{title}'")
+            logging.debug(f"Book ID {book['id']}, URL: {book['text_url']}")
+
+            text_start = time.time()
+            text = _download_book_text(book['text_url'])
+            logging.debug(f"Book text download took {time.time() - text_start:.2f}s")
+            if text is None:
+                continue
+
+            # Remove Project Gutenberg headers and footers
+            text = _trim_gutenberg_boilerplate(text)
+            if len(text) >= padding * 2 + length:
+                break
 
-        logging.info(f"Fetching text for '{title}'")
-        logging.debug(f"Book ID {book_id}, URL: {text_url}")
+            logging.warning(f"Book text too short after trimming ({len(text)} chars)")
+            text = None
 
-        text_start = time.time()
-        text_response = requests.get(text_url, timeout=10)
-        logging.debug(f"Book text download took {time.time() - text_start:.2f}s")
-        if text_response.status_code != 200:
-            logging.error(f"Failed to fetch book text (status {text_response.status_code})")
+        if text is None:
             return None, None
 
-        text = text_response.text
-
         # Extract author metadata
         authors = book.get('authors', [])
         if authors and isinstance(authors[0], dict):
@@ -191,29 +396,18 @@ def get_random_literature(length=LITERATURE_LENGTH, padding=LITERATURE_PADDING):
                 'death_year': None
             }
 
-        # Remove Project Gutenberg headers and footers
-        start_match = re.search(r'\*\*\* START OF (THE|THIS) PROJECT GUTENBERG.*?\*\*\*', text)
-        if start_match:
-            text = text[start_match.end():]
-
-        end_match = re.search(r'\*\*\* END OF (THE|THIS) PROJECT GUTENBERG.*?\*\*\*', text)
-        if end_match:
-            text = text[:end_match.start()]
-
-        if len(text) < padding * 2 + length:
-            logging.warning(f"Book text too short after trimming ({len(text)} chars)")
-            return None, None
-
         # Remove padding from start/end, extract random excerpt
         text = text[padding:-padding]
-        start_pos = random.randint(0, len(text) - length)
-        excerpt = text[start_pos:start_pos + length].strip()
-
-        # Trim to word boundaries
-        first_space = excerpt.find(' ')
-        last_space = excerpt.rfind(' ')
-        if first_space > 0 and last_space > first_space:
-            excerpt = excerpt[first_space + 1:last_space]
+        start_pos = random.randrange(len(text) - length + 1)
+        end_pos = start_pos + length
+
+        # Trim to word boundaries, searching the book directly to avoid an intermediate slice
+        first_space = text.find(' ', start_pos, end_pos)
+        last_space = text.rfind(' ', start_pos, end_pos)
+        if first_space != -1 and last_space > first_space:
+            excerpt = text[first_space + 1:last_space].strip()
+        else:
+            excerpt = text[start_pos:end_pos].strip()
 
         total_time = time.time() - start_time
         logging.debug(f"Total literature fetch time: {total_time:.2f}s")
@@ -238,21 +432,21 @@ def get_navidrome_albums(count=5):
         count: Number of random albums to fetch
 
     Returns:
-        list: Album dicts with 'id', 'name', 'artist', 'year', 'genres' keys, or None on failure
+        list: Album dicts with 'id', 'name', 'artist', 'year', 'genres', 'coverart_id' keys, or None on failure
     """
     try:
         start_time = time.time()
         logging.info(f"Fetching {count} random albums from Navidrome")
 
         api_url = f"{NAVIDROME_BASE}/rest/getAlbumList2.view?u={NAVIDROME_USER}&p={quote(NAVIDROME_PASS)}&v=1.16.1&c={NAVIDROME_CLIENT}&f=json&type=random&size={count}"
-        response = requests.get(api_url)
+        response = SESSION.get(api_url, timeout=DEFAULT_TIMEOUT)
         logging.debug(f"Navidrome album list API call took {time.time() - start_time:.2f}s")
 
         if response.status_code != 200:
             logging.error(f"Navidrome API returned status {response.status_code}")
             return None
 
-        data = response.json()['subsonic-response']['albumList2']['album']
+        data = fastjson.loads(response.content)['subsonic-response']['albumList2']['album']
 
         # Extract relevant fields from each album
         albums = []
@@ -262,7 +456,8 @@ def get_navidrome_albums(count=5):
                 'name': album['name'],
                 'artist': album['artist'],
                 'year': album.get('year', 'Unknown'),
-                'genres': [genre['name'] for genre in album.get('genres', [])]
+                'genres': [genre['name'] for genre in album.get('genres', [])],
+                'coverart_id': album.get('coverArt')
             })
 
         logging.info(f"Successfully fetched {len(albums)} albums")
@@ -274,60 +469,94 @@ def get_navidrome_albums(count=5):
         return None
 
 
-def get_album_details(album_id):
+def _fetch_coverart(coverart_id):
     """
-    Retrieve detailed information about a specific album from Navidrome.
+    Download album cover art from Navidrome.
 
     Args:
-        album_id: Navidrome album ID
+        coverart_id: Navidrome cover art ID
 
     Returns:
-        dict: Album details with 'songs', 'coverart' keys, or None on failure
+        bytes: Raw image data, or None on failure
     """
-    try:
-        start_time = time.time()
-        logging.info(f"Fetching album details (ID: {album_id})")
+    cache_name = "coverart_" + hashlib.sha1(coverart_id.encode('utf-8')).hexdigest()
+    coverart = load_cache_bytes(cache_name, COVERART_CACHE_TTL)
+    if coverart:
+        logging.info("Cover art loaded from cache")
+        return coverart
 
-        api_url = f"{NAVIDROME_BASE}/rest/getAlbum.view?u={NAVIDROME_USER}&p={quote(NAVIDROME_PASS)}&v=1.16.1&c={NAVIDROME_CLIENT}&f=json&id={album_id}"
-        response = requests.get(api_url)
-        logging.debug(f"Navidrome album details API call took {time.time() - start_time:.2f}s")
+    try:
+        logging.debug(f"Fetching cover art (ID: {coverart_id})")
+        api_url = f"{NAVIDROME_BASE}/rest/getCoverArt.view?u={NAVIDROME_USER}&p={quote(NAVIDROME_PASS)}&v=1.16.1&c={NAVIDROME_CLIENT}&id={coverart_id}"
+        art_start = time.time()
+        response = SESSION.get(api_url, timeout=DEFAULT_TIMEOUT)
+        logging.debug(f"Cover art download took {time.time() - art_start:.2f}s")
 
         if response.status_code != 200:
-            logging.error(f"Navidrome API returned status {response.status_code}")
+            logging.warning(f"Cover art API returned status {response.status_code}")
             return None
 
-        album = response.json()['subsonic-response']['album']
+        coverart = response.content
+        save_cache_bytes(cache_name, coverart)
+        logging.info("Cover art fetched successfully")
+        return coverart
 
-        # Build list of songs with streaming URLs
-        songs = []
-        for song in album['song']:
-            song_id = song['id']
-            stream_url = f"{NAVIDROME_BASE}/rest/stream.view?u={NAVIDROME_USER}&p={quote(NAVIDROME_PASS)}&v=1.16.1&c={NAVIDROME_CLIENT}&id={song_id}"
-            songs.append({
-                'title': song['title'],
-                'url': stream_url
-            })
+    except Exception as e:
+        logging.exception(f"Cover art fetch error: {e}")
+        return None
 
-        logging.debug(f"Album has {len(songs)} tracks")
 
-        # Fetch cover art if available
-        coverart_id = album.get('coverArt')
-        if not coverart_id:
-            logging.warning(f"No cover art ID for album {album_id}")
-            coverart = None
-        else:
-            logging.debug(f"Fetching cover art (ID: {coverart_id})")
-            api_url = f"{NAVIDROME_BASE}/rest/getCoverArt.view?u={NAVIDROME_USER}&p={quote(NAVIDROME_PASS)}&v=1.16.1&c={NAVIDROME_CLIENT}&id={coverart_id}"
-            art_start = time.time()
-            response = requests.get(api_url)
-            logging.debug(f"Cover art download took {time.time() - art_start:.2f}s")
+def get_album_details(album_id, coverart_id=None):
+    """
+    Retrieve detailed information about a specific album from Navidrome.
+
+    When the cover art ID is already known (from the album list), the cover art
+    is downloaded concurrently with the album metadata.
+
+    Args:
+        album_id: Navidrome album ID
+        coverart_id: Optional cover art ID (looked up from the album if None)
+
+    Returns:
+        dict: Album details with 'songs', 'coverart' (raw image bytes) keys, or None on failure
+    """
+    try:
+        start_time = time.time()
+        logging.info(f"Fetching album details (ID: {album_id})")
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            coverart_future = executor.submit(_fetch_coverart, coverart_id) if coverart_id else None
+
+            api_url = f"{NAVIDROME_BASE}/rest/getAlbum.view?u={NAVIDROME_USER}&p={quote(NAVIDROME_PASS)}&v=1.16.1&c={NAVIDROME_CLIENT}&f=json&id={album_id}"
+            response = SESSION.get(api_url, timeout=DEFAULT_TIMEOUT)
+            logging.debug(f"Navidrome album details API call took {time.time() - start_time:.2f}s")
 
             if response.status_code != 200:
-                logging.warning(f"Cover art API returned status {response.status_code}")
-                coverart = None
+                logging.error(f"Navidrome API returned status {response.status_code}")
+                return None
+
+            album = fastjson.loads(response.content)['subsonic-response']['album']
+
+            # Build list of songs with streaming URLs
+            songs = []
+            for song in album['song']:
+                song_id = song['id']
+                stream_url = f"{NAVIDROME_BASE}/rest/stream.view?u={NAVIDROME_USER}&p={quote(NAVIDROME_PASS)}&v=1.16.1&c={NAVIDROME_CLIENT}&id={song_id}"
+                songs.append({
+                    'title': song['title'],
+                    'url': stream_url
+                })
+
+            logging.debug(f"Album has {len(songs)} tracks")
+
+            # Collect cover art (already in flight if its ID was known up front)
+            if coverart_future:
+                coverart = coverart_future.result()
+            elif album.get('coverArt'):
+                coverart = _fetch_coverart(album['coverArt'])
             else:
-                coverart = base64.b64encode(response.content).decode('utf-8')
-                logging.info("Cover art fetched successfully")
+                logging.warning(f"No cover art ID for album {album_id}")
+                coverart = None
 
         total_time = time.time() - start_time
         logging.debug(f"Total album details fetch time: {total_time:.2f}s")
@@ -0,0 +1,49 @@
+"""
+JSON Helpers for Daily Greeting Generator
+
+Decodes and encodes JSON with orjson when it is installed (C-backed, several
+times faster on large API responses), falling back to the standard library
+json module otherwise.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data):
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        object: Parsed JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value, indent=False):
+    """
+    Serialize a value to a JSON string.
+
+    Non-ASCII characters are written as-is in both backends.
+
+    Args:
+        value: JSON-serializable value
+        indent: Pretty-print with two-space indentation instead of compact output
+
+    Returns:
+        str: JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+    if indent:
+        return json.dumps(value, indent=2, ensure_ascii=False)
+    return json.dumps(value, ensure_ascii=False)
@@ -21,11 +21,18 @@ def format_weather(weather_data):
         logging.warning("No weather data provided for formatting")
         return "WEATHER DATA: Not available"
 
-    overnight = f"Overnight: {weather_data['overnight']['description']} {weather_data['overnight']['precipitation']}% chance of precipitation."
+    overnight_data = weather_data['overnight']
+    sunrise_data = weather_data['sunrise']
+    today_data = weather_data['today']
 
-    sunrise = f"Sunrise (NOW): {weather_data['sunrise']['temperature']}°F, {weather_data['sunrise']['conditions']}, {weather_data['sunrise']['humidity']}% humidity, dewpoint {weather_data['sunrise']['dewpoint']:.2f}°C, wind {weather_data['sunrise']['windSpeed']} from {weather_data['sunrise']['windDirection']}, {weather_data['sunrise']['precipitation']}% chance of precipitation."
+    overnight = f"Overnight: {overnight_data['description']} {overnight_data['precipitation']}% chance of precipitation."
 
-    today = f"Today ({weather_data['today']['dayOfWeek']}): {weather_data['today']['description']} {weather_data['today']['precipitation']}% chance of precipitation."
+    # NWS reports a null dewpoint for some hours; omit the clause rather than fail on the format spec
+    dewpoint = sunrise_data['dewpoint']
+    dewpoint_text = f"dewpoint {dewpoint:.2f}°C, " if dewpoint is not None else ""
+    sunrise = f"Sunrise (NOW): {sunrise_data['temperature']}°F, {sunrise_data['conditions']}, {sunrise_data['humidity']}% humidity, {dewpoint_text}wind {sunrise_data['windSpeed']} from {sunrise_data['windDirection']}, {sunrise_data['precipitation']}% chance of precipitation."
+
+    today = f"Today ({today_data['dayOfWeek']}): {today_data['description']} {today_data['precipitation']}% chance of precipitation."
 
     return "WEATHER DATA:\n" + overnight + "\n" + sunrise + "\n" + today
 
@@ -44,13 +51,28 @@ def format_literature(literature_data):
         logging.warning("No literature data provided for formatting")
         return "LITERATURE EXCERPT: Not available"
 
-    author_info = literature_data['author']['name']
-    if literature_data['author']['birth_year'] and literature_data['author']['death_year']:
-        author_info += f" ({literature_data['author']['birth_year']}-{literature_data['author']['death_year']})"
+    author = literature_data['author']
+    author_info = author['name']
+    if author['birth_year'] and author['death_year']:
+        author_info += f" ({author['birth_year']}-{author['death_year']})"
 
     return f'LITERATURE EXCERPT: "{literature_data["title"]}" by {author_info}:\n\n{literature_data["excerpt"]}'
 
 
+def format_literature_options(literature_list):
+    """
+    Format several literature candidates into a numbered string.
+
+    Args:
+        literature_list: List of literature dicts with 'title', 'author', 'excerpt' keys
+
+    Returns:
+        str: Formatted numbered list of excerpts with title and author info
+    """
+    return "\n\n".join(f"[{index + 1}] {format_literature(literature)}"
+                       for index, literature in enumerate(literature_list))
+
+
 def format_albums(album_data):
     """
     Format album list into a human-readable numbered string.
@@ -61,12 +83,10 @@ def format_albums(album_data):
     Returns:
         str: Formatted numbered list of albums with metadata
     """
-    album_lines = []
-    for index, album in enumerate(album_data):
-        genres = ', '.join(album['genres']) if album['genres'] else 'Unknown genre'
-        album_lines.append(f"[{index + 1}] \"{album['name']}\" by {album['artist']} ({album['year']}) - Genres: {genres}")
-
-    return "ALBUMS:\n" + "\n".join(album_lines)
+    return "ALBUMS:\n" + "\n".join(
+        f"[{index}] \"{album['name']}\" by {album['artist']} ({album['year']}) - Genres: {', '.join(album['genres']) or 'Unknown genre'}"
+        for index, album in enumerate(album_data, 1)
+    )
 
 
 def format_album(album_data):
@@ -85,11 +105,7 @@ def format_album(album_data):
 
     genres = ', '.join(album_data['genres']) if album_data['genres'] else 'Unknown genre'
 
-    song_lines = []
-    for index, song in enumerate(album_data['songs']):
-        song_lines.append(f"{index + 1}. {song['title']}")
-
-    tracklist = "\n".join(song_lines)
+    tracklist = "\n".join(f"{index}. {song['title']}" for index, song in enumerate(album_data['songs'], 1))
     string = f"""SELECTED ALBUM: \"{album_data['name']}\" by {album_data['artist']} ({album_data['year']})
 Genres: {genres}
 Tracklist:
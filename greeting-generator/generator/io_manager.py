@@ -10,13 +10,17 @@ Handles all file operations including:
 - Album cover art saving
 """
 
-import json
+import os
+import sys
 import logging
 from pathlib import Path
 from datetime import datetime
 
+from . import fastjson
 from .llm import MODEL, IMAGE_MODEL
 
+PIPELINE_BUFFER_SIZE = 64 * 1024  # Pipeline trace is flushed per section, not per write
+
 
 class IOManager:
     """Manages all file I/O for pipeline execution."""
@@ -30,22 +34,28 @@ class IOManager:
             date_str: Optional date string (YYYY-MM-DD). If None, uses today's date.
         """
         self.base_dir = Path(base_dir)
-        self.base_dir.mkdir(exist_ok=True)
 
-        # Create dated subdirectory
+        # Create dated subdirectory (and base/data parents) in one call
         self.date_str = date_str if date_str else datetime.now().strftime(r"%Y-%m-%d")
 
         self.data_dir = self.base_dir / "data" / self.date_str
-        self.data_dir.mkdir(exist_ok=True)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
 
         # Pipeline output file handle
         self.pipeline_file = None
 
+        # In-memory pipeline data, written to data_{date}.json by flush_data_file().
+        # Each update is also appended to a JSONL journal so a killed run loses nothing.
+        self.data_path = self.data_dir / f"data_{self.date_str}.json"
+        self.journal_path = self.data_dir / f"data_{self.date_str}.jsonl"
+        self._data = None
+        self._data_dirty = False
+
     def init_pipeline_file(self):
         """Initialize pipeline output file for prompts and responses."""
 
         pipeline_path = self.data_dir / f"pipeline_{self.date_str}.txt"
-        self.pipeline_file = open(pipeline_path, 'a', encoding='utf-8')
+        self.pipeline_file = open(pipeline_path, 'a', encoding='utf-8', buffering=PIPELINE_BUFFER_SIZE)
         
         logging.info(f"Pipeline output will be saved to {pipeline_path}")
 
@@ -64,6 +74,10 @@ Ollama multimodal vision model: {IMAGE_MODEL}""")
         """
         if self.pipeline_file:
             self.pipeline_file.write(text + "\n")
+
+    def flush_pipeline(self):
+        """Flush buffered pipeline output to disk."""
+        if self.pipeline_file:
             self.pipeline_file.flush()
 
     def print_section(self, title, content=None):
@@ -75,54 +89,105 @@ Ollama multimodal vision model: {IMAGE_MODEL}""")
             content: Optional content to print
         """
         separator = "\n" + "=" * 50
-        header = f"{separator}\n{title}{separator}"
-        print(header)
-        self.write_to_pipeline(header)
-
+        payload = f"{separator}\n{title}{separator}\n"
         if content:
-            print(content)
-            self.write_to_pipeline(content)
+            payload += content + "\n"
+
+        # Build the block once and write it to both outputs
+        sys.stdout.write(payload)
+        if self.pipeline_file:
+            self.pipeline_file.write(payload)
+
+        # Section boundary: keep the trace current for anyone tailing the file
+        self.flush_pipeline()
+
+    def _read_data(self):
+        """
+        Read saved pipeline data, replaying any journaled updates.
+
+        Returns:
+            dict: data_{date}.json contents merged with updates from an
+                unflushed journal (empty if neither exists)
+        """
+        data = {}
+        if self.data_path.exists():
+            with open(self.data_path, 'rb') as f:
+                data = fastjson.loads(f.read())
+
+        # Journal left behind by a run that never reached flush_data_file()
+        if self.journal_path.exists():
+            with open(self.journal_path, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        data.update(fastjson.loads(line))
+            logging.debug(f"Replayed journaled updates from {self.journal_path}")
+
+        return data
 
     def update_data_file(self, **kwargs):
         """
-        Update data_{date}.json with new fields as they're generated.
+        Update pipeline data with new fields as they're generated.
+
+        Updates are kept in memory and appended to data_{date}.jsonl, then
+        written to data_{date}.json once by flush_data_file() (called
+        automatically on close).
 
         Args:
             **kwargs: Field name and value pairs to add/update in JSON
         """
-        data_path = self.data_dir / f"data_{self.date_str}.json"
-
-        # Load existing data if file exists
-        if data_path.exists():
-            with open(data_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        else:
-            data = {}
+        # Load existing data once so same-day reruns merge into the file
+        if self._data is None:
+            self._data = self._read_data()
 
         # Update with new fields
-        data.update(kwargs)
-        print(json.dumps(kwargs, indent=2))
+        self._data.update(kwargs)
+        self._data_dirty = True
+
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            f.write(fastjson.dumps(kwargs) + "\n")
+        print(fastjson.dumps(kwargs, indent=True))
+
+    def flush_data_file(self):
+        """
+        Write pending pipeline data updates to data_{date}.json.
 
-        # Write back to file
-        with open(data_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        Writes to a temporary file and renames it into place, so a crash
+        mid-write never leaves a truncated data file behind, then discards
+        the journal it supersedes.
+        """
+        if not self._data_dirty:
+            return
 
-    def load_data_file(self):
+        tmp_path = self.data_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(fastjson.dumps(self._data, indent=True))
+        os.replace(tmp_path, self.data_path)
+        self.journal_path.unlink(missing_ok=True)
+        self._data_dirty = False
+        logging.debug(f"Flushed data file to {self.data_path}")
+
+    def load_data_file(self, missing_ok=False):
         """
         Load previously saved data_{date}.json file.
 
+        Args:
+            missing_ok: Return an empty dict instead of logging an error when no data is saved yet
+
         Returns:
             dict: Loaded pipeline data with 'weather', 'literature', 'album' keys, or None on failure
         """
-        data_path = self.data_dir / f"data_{self.date_str}.json"
+        # Make sure pending in-memory updates are on disk first
+        self.flush_data_file()
+        data_path = self.data_path
 
-        if not data_path.exists():
+        if not data_path.exists() and not self.journal_path.exists():
+            if missing_ok:
+                return {}
             logging.error(f"Data file not found: {data_path}")
             return None
 
         try:
-            with open(data_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._read_data()
             logging.info(f"Loaded data from {data_path}")
             return data
         except Exception as e:
@@ -153,7 +218,8 @@ Ollama multimodal vision model: {IMAGE_MODEL}""")
             image_data: Raw bytes of JPEG image
         """
         coverart_path = self.data_dir / f"coverart_{self.date_str}.jpg"
-        with open(coverart_path, "wb") as f:
+        # Single large write: skip the intermediate Python buffer
+        with open(coverart_path, "wb", buffering=0) as f:
             f.write(image_data)
         logging.info(f"Saved cover art to {coverart_path}")
 
@@ -189,7 +255,9 @@ Ollama multimodal vision model: {IMAGE_MODEL}""")
             return None
 
     def close(self):
-        """Close the pipeline file handle."""
+        """Flush pending data updates and close the pipeline file handle."""
+        self.flush_data_file()
+
         if self.pipeline_file:
             self.pipeline_file.close()
             self.pipeline_file = None
@@ -200,7 +268,7 @@ Ollama multimodal vision model: {IMAGE_MODEL}""")
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - close pipeline file."""
+        """Context manager exit - flush data and close pipeline file."""
         self.close()
         return False  # Don't suppress exceptions
 
@@ -219,22 +287,23 @@ def setup_logging(io_manager, logging_level=logging.INFO):
     root_logger = logging.getLogger()
     root_logger.setLevel(logging_level)
 
-    # Remove existing handlers
+    # Remove existing handlers, flushing and closing them so no records or file handles leak
     for handler in root_logger.handlers[:]:
+        handler.flush()
+        handler.close()
         root_logger.removeHandler(handler)
 
-    # Add file and console handlers
-    file_handler = logging.FileHandler(log_path, mode='a')
-    file_handler.setFormatter(logging.Formatter(
+    # Add file and console handlers sharing one formatter
+    formatter = logging.Formatter(
         '[%(asctime)s] %(levelname)s: %(message)s',
         datefmt='%H:%M:%S'
-    ))
+    )
+
+    file_handler = logging.FileHandler(log_path, mode='a')
+    file_handler.setFormatter(formatter)
 
     console_handler = logging.StreamHandler()
-    console_handler.setFormatter(logging.Formatter(
-        '[%(asctime)s] %(levelname)s: %(message)s',
-        datefmt='%H:%M:%S'
-    ))
+    console_handler.setFormatter(formatter)
 
     root_logger.addHandler(file_handler)
     root_logger.addHandler(console_handler)
@@ -4,69 +4,88 @@ Random word generation based on a provided text file.
 Implements N-gram markov chains to mimic english phonetics.
 """
 import unicodedata
+import hashlib
 import re
 import random
 import logging
+import bisect
+import itertools
+from collections import defaultdict, Counter
+
+from .cache import load_cache, save_cache
 
 UNICODE_FIXES = str.maketrans({
     '\u2018': "'",  # LEFT SINGLE QUOTATION MARK
     '\u2019': "'",  # RIGHT SINGLE QUOTATION MARK
 })
+MULTI_HYPHEN_PATTERN = re.compile(r'-{2,}')  # Two or more hyphens (em-dash stand-ins)
 
 INITIATOR = '#'
 TERMINATOR = '$'
 CONTEXT_SIZE = 2
+MARKOV_CACHE_TTL = 7 * 24 * 3600  # Reuse the parsed model for reruns on the same book
+
+
+class _CharFilterTable(dict):
+    """
+    str.translate table that keeps letters, combining marks, apostrophes and
+    hyphens, and maps everything else to a space.
+
+    Entries are computed on first sight of each code point and cached, so a
+    book only pays for unicodedata.category() once per distinct character.
+    """
 
-def parse_words(io_manager):
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        category = unicodedata.category(char)
+        if (category.startswith('L') or # Letters (all types)
+            category == 'Mn' or         # Combining marks
+            char in "'-"):              # Desired special chars
+            value = codepoint
+        else:
+            value = ord(' ')
+        self[codepoint] = value
+        return value
+
+
+CHAR_FILTER = _CharFilterTable()
+
+def parse_words(text):
     """
-    Fetches and parses the selected book into a list of unique words.
+    Parses the selected book's text into a list of unique words.
 
     Normalizes unicode into NFKD so that diacritics are preserved.
     Apostrophes are standardized and preserved, as are compound word hyphenations.
     Punctuation and extraneous special characters are properly stripped.
 
     Args:
-        io_manager: The IOManager currently in use
+        text: The full text of the selected book
     
     Returns:
         list: The unique words in the book, properly encoded
     """
     try:
-        # Load the book and verify
-        text = io_manager.load_book()
-        if text is None:
-            logging.warning("No stored book found")
-            return None
-        
         logging.info("Normalizing and fixing Unicode encoding")
         # Step 1: Normalize and fix Unicode
         text = unicodedata.normalize('NFKD', text)
         text = text.lower()  # Lowers certain unicode fixes
         text = text.translate(UNICODE_FIXES)
-        text = re.sub(r'-{2,}', ' ', text)   # Two or more hyphens
+        text = MULTI_HYPHEN_PATTERN.sub(' ', text)
 
         logging.info("Stripping undesired special characters")
         # Step 2: Strip special characters
-        result = []
-        for char in text:
-            category = unicodedata.category(char)
-            if (category.startswith('L') or # Letters (all types)
-                category == 'Mn' or         # Combining marks
-                char in "'-"):              # Desired special chars
-                result.append(char)
-            else:
-                result.append(' ')
-        
-        text = ''.join(result)
+        text = text.translate(CHAR_FILTER)
 
         logging.info("Tokenizing text and collapsing duplicates")
         # Step 3: Split words, discard short ones, count frequency
         rawlist = text.split()
         wordlist = []
+        seen = set()  # O(1) duplicate checks; wordlist keeps first-seen order
         for word in rawlist:
             word = word.strip('-')
             if len(word) > CONTEXT_SIZE:
-                if word not in wordlist:
+                if word not in seen:
+                    seen.add(word)
                     wordlist.append(word)
 
         return wordlist
@@ -86,7 +105,7 @@ def build_model(wordlist):
     Returns:
         dict: The letter probability weights for all present letter combinations
     """
-    model = {}
+    model = defaultdict(Counter)
 
     logging.info("Buliding Markov chain model from text")
     for word in wordlist:
@@ -95,17 +114,34 @@ def build_model(wordlist):
         # For each character in the word following the initiator
         for i in range(1, len(word)):
             # Get the context and current letter
-            context = word[:i][-CONTEXT_SIZE:]
+            context = word[max(0, i - CONTEXT_SIZE):i]
             letter = word[i]
-            # Make sure the requisite dictionary entries exist
-            if context not in model.keys():
-                model[context] = {}
-            if letter not in model[context].keys():
-                model[context][letter] = 0
-            # Increment the appropriate counter
+            # Increment the appropriate counter (entries are created on first use)
             model[context][letter] += 1
     
-    return model
+    return dict(model)
+
+
+def compile_model(model):
+    """
+    Precomputes cumulative letter weights for each context of the model.
+
+    The terminator is kept out of the cumulative weights so that its
+    length-dependent scaling needs no per-step copies while sampling.
+
+    Args:
+        model: The dict markov chain model from build_model()
+
+    Returns:
+        dict: Each context mapped to (letters, cumulative weights, terminator weight)
+    """
+    compiled = {}
+    for context, weights in model.items():
+        letters = [letter for letter in weights if letter != TERMINATOR]
+        cum_weights = list(itertools.accumulate(weights[letter] for letter in letters))
+        compiled[context] = (letters, cum_weights, weights.get(TERMINATOR, 0))
+
+    return compiled
 
 
 def length_distribution(wordlist):
@@ -131,14 +167,16 @@ def length_distribution(wordlist):
     distribution = dict(sorted(distribution.items(), key=lambda item: item[0]))
 
     cumulative = [0]
+    total = sum(distribution.values())
 
-    for i in range(1, max(distribution.keys()) + 1):
+    for i in range(1, max(distribution) + 1):
         value = cumulative[-1]
-        if i in distribution.keys():
-            value += (distribution[i] / sum(distribution.values())) ** 0.5
+        if i in distribution:
+            value += (distribution[i] / total) ** 0.5
         cumulative.append(value)
     
-    logging.debug(f"Flattened, normalized, cumulative word length distrbution:\n{cumulative}")
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug(f"Flattened, normalized, cumulative word length distrbution:\n{cumulative}")
 
     return cumulative
 
@@ -150,7 +188,7 @@ def generate_word(model, distribution):
     Weights terminator probablility based on the provided distribution.
 
     Args:
-        model: The dict markov chain model with letter probabilities
+        model: The compiled markov chain model from compile_model()
         distribution: The terminator probability factors
 
     Returns:
@@ -159,15 +197,17 @@ def generate_word(model, distribution):
     word = INITIATOR
 
     while word[-1] != TERMINATOR:
-        context = word[-CONTEXT_SIZE:]
-        weights = model[context]
-        if TERMINATOR in weights.keys():
-            weights = weights.copy()
-            if len(word) < len(distribution):
-                weights[TERMINATOR] *= distribution[len(word)]
-            else:
-                weights[TERMINATOR] *= distribution[-1]
-        word += random.choices(list(weights.keys()), list(weights.values()))[0]
+        letters, cum_weights, terminator_weight = model[word[-CONTEXT_SIZE:]]
+        if terminator_weight:
+            terminator_weight *= distribution[min(len(word), len(distribution) - 1)]
+
+        # Sample over the letters followed by the scaled terminator
+        letters_total = cum_weights[-1] if cum_weights else 0
+        point = random.random() * (letters_total + terminator_weight)
+        if point >= letters_total:
+            word += TERMINATOR
+        else:
+            word += letters[bisect.bisect(cum_weights, point)]
     
     return word.strip(INITIATOR + TERMINATOR)
 
@@ -184,13 +224,32 @@ def generate_words(io_manager, count):
         list: The list of generated words
     """
 
-    wordlist = parse_words(io_manager)
-    if wordlist is None:
-        logging.warning("No Jabberwocky words generated")
+    # Load the book and verify
+    text = io_manager.load_book()
+    if text is None:
+        logging.warning("No stored book found")
         return None
 
-    model = build_model(wordlist)
-    distribution = length_distribution(wordlist)
+    # Parsing and model building only depend on the book, so reruns reuse them
+    book_hash = hashlib.sha1(text.encode('utf-8')).hexdigest()
+    cached = load_cache("markov_model", MARKOV_CACHE_TTL)
+    if cached and cached['book_hash'] == book_hash:
+        logging.info("Using cached Markov chain model for this book")
+        wordlist, model, distribution = cached['wordlist'], cached['model'], cached['distribution']
+    else:
+        wordlist = parse_words(text)
+        if wordlist is None:
+            logging.warning("No Jabberwocky words generated")
+            return None
+
+        model = compile_model(build_model(wordlist))
+        distribution = length_distribution(wordlist)
+        save_cache("markov_model", {
+            'book_hash': book_hash,
+            'wordlist': wordlist,
+            'model': model,
+            'distribution': distribution
+        })
 
     logging.info("Generating {count} Jabberwocky words")
     generated = []
@@ -4,48 +4,144 @@ LLM Interface for Daily Greeting Generator
 Handles communication with Ollama API for text generation and vision tasks.
 """
 
-import requests
+import hashlib
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import pybase64 as base64  # SIMD-accelerated drop-in for the stdlib module
+except ImportError:
+    import base64
+
+from . import fastjson
+from .session import OLLAMA_SESSION, OLLAMA_TIMEOUT, DEFAULT_TIMEOUT
+from .cache import load_cache, save_cache
 
 
 # Ollama API configuration
 OLLAMA_BASE = "http://192.168.1.134:11434"
 MODEL = "llama3.2:3b"
 IMAGE_MODEL = "gemma3:4b"
+OLLAMA_CACHE_TTL = 0  # Seconds to reuse responses to identical prompts (0 disables, for dev iteration)
+VISION_CACHE_TTL = 30 * 24 * 3600  # Seconds to reuse descriptions of identical images (0 disables)
+KEEP_ALIVE = "30m"  # How long the text model stays resident between pipeline stages
+KEEP_MODELS_LOADED = False  # Skip the end-of-run unload (only when Ollama doesn't share the TTS GPU)
+NUM_CTX_SMALL = None  # Context window for short selection prompts (None uses the server default)
+NUM_CTX_LARGE = None  # Context window for the synthesis prompt (None uses the server default)
+
+
+def _stream_generate(payload, label="Ollama"):
+    """
+    POST a generate request with streaming enabled and assemble the reply.
+
+    Ollama streams one JSON object per line, each carrying a token fragment,
+    with a final object marked "done".
+
+    Args:
+        payload: Request body for /api/generate ("stream" is forced on)
+        label: Log prefix identifying the request type
+
+    Returns:
+        tuple: (response text, done_reason) where done_reason is Ollama's stop
+            reason from the final chunk ("stop", or "length" when num_predict cut
+            the output short), or (None, None) on HTTP or in-stream error
+    """
+    start_time = time.time()
+    payload = dict(payload, stream=True)
+
+    with OLLAMA_SESSION.post(OLLAMA_BASE + "/api/generate", json=payload, stream=True, timeout=OLLAMA_TIMEOUT) as response:
+        if response.status_code != 200:
+            logging.error(f"{label} API returned status {response.status_code}")
+            return None, None
+
+        fragments = []
+        done_reason = None
+        first_token_time = None
+        for line in response.iter_lines():
+            if not line:
+                continue
 
+            chunk = fastjson.loads(line)
+            if 'error' in chunk:
+                logging.error(f"{label} stream error: {chunk['error']}")
+                return None, None
 
-def send_ollama_request(prompt):
+            if first_token_time is None:
+                first_token_time = time.time() - start_time
+                logging.debug(f"{label} first token after {first_token_time:.2f}s")
+
+            fragments.append(chunk.get('response', ''))
+            if chunk.get('done'):
+                done_reason = chunk.get('done_reason')
+                break
+
+    api_time = time.time() - start_time
+    logging.debug(f"{label} API call took {api_time:.2f}s")
+
+    return ''.join(fragments), done_reason
+
+
+def send_ollama_request(prompt, long_context=False, num_predict=None, json_schema=None, allow_truncated=True):
     """
     Send a prompt to the Ollama API and return the response text.
 
+    Identical model/prompt pairs are served from the disk cache when
+    OLLAMA_CACHE_TTL is enabled.
+
     Args:
         prompt: The text prompt to send
+        long_context: Use NUM_CTX_LARGE instead of NUM_CTX_SMALL as the context window
+        num_predict: Maximum tokens to generate (None leaves generation uncapped)
+        json_schema: Optional JSON schema the response must follow (Ollama structured output)
+        allow_truncated: If False, a response cut off by num_predict counts as a failure
 
     Returns:
         str: LLM response text, or None on failure
     """
+    num_ctx = NUM_CTX_LARGE if long_context else NUM_CTX_SMALL
+
+    cache_name = None
+    if OLLAMA_CACHE_TTL:
+        cache_name = "ollama_" + hashlib.sha256(f"{MODEL}\0{num_ctx}\0{num_predict}\0{json_schema}\0{prompt}".encode('utf-8')).hexdigest()
+        cached = load_cache(cache_name, OLLAMA_CACHE_TTL)
+        if cached is not None:
+            logging.info(f"Using cached Ollama response ({MODEL})")
+            return cached
+
     unload_model(IMAGE_MODEL)
-    start_time = time.time()
     logging.info(f"Sending request to Ollama ({MODEL})")
 
     payload = {
         "model": MODEL,
         "prompt": prompt,
-        "stream": False
+        "keep_alive": KEEP_ALIVE
     }
+    options = {}
+    if num_ctx:
+        options["num_ctx"] = num_ctx
+    if num_predict:
+        options["num_predict"] = num_predict
+    if options:
+        payload["options"] = options
+    if json_schema:
+        payload["format"] = json_schema
 
     try:
-        response = requests.post(OLLAMA_BASE + "/api/generate", json=payload)
-        api_time = time.time() - start_time
-        logging.debug(f"Ollama API call took {api_time:.2f}s")
-
-        if response.status_code != 200:
-            logging.error(f"Ollama API returned status {response.status_code}")
+        result, done_reason = _stream_generate(payload, "Ollama")
+        if result is None:
             return None
 
-        result = response.json()['response']
         logging.debug(f"Received response ({len(result)} chars)")
+
+        if done_reason == "length":
+            if not allow_truncated:
+                logging.error(f"Ollama response truncated at num_predict={num_predict} tokens")
+                return None
+            logging.warning(f"Ollama response truncated at num_predict={num_predict} tokens")
+
+        if cache_name:
+            save_cache(cache_name, result)
         logging.info("Ollama request completed successfully")
 
         return result
@@ -55,40 +151,49 @@ def send_ollama_request(prompt):
         return None
 
 
-def send_ollama_image_request(prompt, image_base64):
+def send_ollama_image_request(prompt, image_bytes):
     """
     Send a prompt with an image to the Ollama API and return the response text.
 
+    Identical model/prompt/image combinations (e.g. an album picked again)
+    are served from the disk cache when VISION_CACHE_TTL is enabled.
+
     Args:
         prompt: The text prompt to send
-        image_base64: Base64-encoded image string
+        image_bytes: Raw image data (base64-encoded here for the request)
 
     Returns:
         str: Vision model response text, or None on failure
     """
+    cache_name = None
+    if VISION_CACHE_TTL:
+        key = hashlib.sha256(f"{IMAGE_MODEL}\0{prompt}\0".encode('utf-8'))
+        key.update(image_bytes)
+        cache_name = "vision_" + key.hexdigest()
+        cached = load_cache(cache_name, VISION_CACHE_TTL)
+        if cached is not None:
+            logging.info(f"Using cached vision response ({IMAGE_MODEL})")
+            return cached
+
     unload_model(MODEL)
 
-    start_time = time.time()
     logging.info(f"Sending vision request to Ollama ({IMAGE_MODEL})")
 
     payload = {
         "model": IMAGE_MODEL,
         "prompt": prompt,
-        "images": [image_base64],
-        "stream": False
+        "images": [base64.b64encode(image_bytes).decode('ascii')]
     }
 
     try:
-        response = requests.post(OLLAMA_BASE + "/api/generate", json=payload)
-        api_time = time.time() - start_time
-        logging.debug(f"Ollama vision API call took {api_time:.2f}s")
-
-        if response.status_code != 200:
-            logging.error(f"Ollama vision API returned status {response.status_code}")
+        result, _ = _stream_generate(payload, "Ollama vision")
+        if result is None:
             return None
 
-        result = response.json()['response']
         logging.debug(f"Received vision response ({len(result)} chars)")
+
+        if cache_name:
+            save_cache(cache_name, result)
         logging.info("Ollama vision request completed successfully")
 
         return result
@@ -98,6 +203,42 @@ def send_ollama_image_request(prompt, image_base64):
         return None
 
 
+def load_model(model_name):
+    """
+    Load a model into Ollama ahead of its first prompt.
+
+    Sends a request with no prompt, which loads the model without
+    generating, so the load overlaps other work instead of delaying the
+    first real request.
+
+    Args:
+        model_name: Name of the model to load (e.g., "llama3.2:3b")
+
+    Returns:
+        bool: True if load request succeeded, False on failure
+    """
+    logging.info(f"Preloading model into Ollama ({model_name})")
+
+    payload = {
+        "model": model_name,
+        "keep_alive": KEEP_ALIVE
+    }
+
+    try:
+        response = OLLAMA_SESSION.post(OLLAMA_BASE + "/api/generate", json=payload, timeout=OLLAMA_TIMEOUT)
+
+        if response.status_code != 200:
+            logging.error(f"Ollama load API returned status {response.status_code}")
+            return False
+
+        logging.info(f"Model loaded successfully ({model_name})")
+        return True
+
+    except Exception as e:
+        logging.exception(f"Ollama load error: {e}")
+        return False
+
+
 def unload_model(model_name):
     """
     Explicitly unload a model from Ollama to free GPU memory.
@@ -120,7 +261,7 @@ def unload_model(model_name):
     }
 
     try:
-        response = requests.post(OLLAMA_BASE + "/api/generate", json=payload)
+        response = OLLAMA_SESSION.post(OLLAMA_BASE + "/api/generate", json=payload, timeout=DEFAULT_TIMEOUT)
 
         if response.status_code != 200:
             logging.error(f"Ollama unload API returned status {response.status_code}")
@@ -138,16 +279,21 @@ def unload_all_models():
     """
     Unload all models used by the pipeline from Ollama.
 
-    Calls unload_model() for both the text model and vision model to free
-    all GPU memory after pipeline completion.
+    Calls unload_model() for both the text model and vision model
+    concurrently to free all GPU memory after pipeline completion.
+    Does nothing when KEEP_MODELS_LOADED is set.
 
     Returns:
-        bool: True if all models unloaded successfully, False if any failed
+        bool: True if all models unloaded successfully (or unloading is disabled), False if any failed
     """
+    if KEEP_MODELS_LOADED:
+        logging.info(f"Keeping models loaded (keep_alive={KEEP_ALIVE})")
+        return True
+
     logging.info("Unloading all pipeline models")
 
-    text_success = unload_model(MODEL)
-    vision_success = unload_model(IMAGE_MODEL)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        text_success, vision_success = executor.map(unload_model, [MODEL, IMAGE_MODEL])
 
     if text_success and vision_success:
         logging.info("All models unloaded successfully")
@@ -11,12 +11,14 @@ Multi-stage LLM pipeline:
 
 import re
 import math
-import base64
 import random
 import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor
 
+from . import fastjson
 from .data_sources import get_random_literature, get_navidrome_albums, get_album_details
-from .formatters import format_literature, format_albums, format_album, format_weather, format_jabberwocky
+from .formatters import format_literature, format_literature_options, format_albums, format_album, format_weather, format_jabberwocky
 from .llm import send_ollama_request, send_ollama_image_request
 from .jabberwocky import generate_words
 
@@ -24,52 +26,84 @@ MESSAGE_MEAN_LEN = 140
 MESSAGE_Q1_LEN = 100
 MESSAGE_MIN_LEN = 80
 
+LITERATURE_BATCH_SIZE = 3  # Candidate excerpts evaluated per LLM call
+VERDICT_NUM_PREDICT = 256  # Output token cap for short reasoning + verdict responses
+SYNTHESIS_REASONING_TOKENS = 4096  # Output token allowance for synthesis reasoning, on top of the greeting
+
+# LLM verdict parsers
+VERDICT_NUMBER_OR_NONE_PATTERN = re.compile(r'VERDICT:\s*(\d+|NONE)', re.IGNORECASE)
+
+# Synthesis response section header (tolerates markdown emphasis around it)
+GREETING_MARKER_PATTERN = re.compile(r'^[\s*#]*GREETING:[*\s]*', re.IGNORECASE | re.MULTILINE)
+
 
 def validate_literature(io_manager, max_attempts=5):
     """
-    Fetch and validate literature excerpt using LLM evaluation.
+    Fetch and validate literature excerpts using LLM evaluation.
+
+    Each attempt downloads LITERATURE_BATCH_SIZE candidates concurrently and
+    asks the LLM to pick the most suitable one (or none) in a single prompt.
 
     Args:
         io_manager: IOManager instance for output
-        max_attempts: Maximum number of attempts to find suitable literature
+        max_attempts: Maximum number of candidate batches to evaluate
 
     Returns:
         dict: Validated literature data with 'title', 'author', 'excerpt' keys, or None if max attempts reached
     """
     logging.info("Starting literature validation")
 
-    for attempt in range(1, max_attempts + 1):
-        logging.debug(f"Literature validation attempt {attempt}/{max_attempts}")
-        literature, text = get_random_literature()
+    # A batch is only fetched when an attempt needs it (first try, or after a rejection),
+    # so a first-try success never pays for extra book downloads
+    with ThreadPoolExecutor(max_workers=LITERATURE_BATCH_SIZE) as executor:
+        for attempt in range(1, max_attempts + 1):
+            logging.debug(f"Literature validation attempt {attempt}/{max_attempts}")
+            batch_futures = [executor.submit(get_random_literature) for _ in range(LITERATURE_BATCH_SIZE)]
+            candidates = [future.result() for future in batch_futures]
+            candidates = [(literature, text) for literature, text in candidates if literature]
 
-        if not literature:
-            logging.warning(f"Literature fetch failed on attempt {attempt}, retrying")
-            continue
+            if not candidates:
+                logging.warning(f"No literature fetched on attempt {attempt}, retrying")
+                continue
 
-        formatted_lit = format_literature(literature)
-        literature_prompt = f"""Please evaluate whether the following literary excerpt is interesting material from which to source literary style or elements for creative writing.
-
-{formatted_lit}
+            formatted_lit = format_literature_options([literature for literature, _ in candidates])
+            # Fixed instructions first, excerpts last: retries share the prompt prefix,
+            # so Ollama can reuse its cached prefill for it
+            literature_prompt = f"""Please evaluate whether each of the following literary excerpts is interesting material from which to source literary style or elements for creative writing.
 
 Respond in the following format exactly:
-REASONING: One sentence reasoning about the suitability of the text.
-VERDICT: YES if suitable NO if not"""
+REASONING: One sentence per excerpt reasoning about its suitability.
+VERDICT: [number only] of the most suitable excerpt (1-{len(candidates)}), or NONE if none are suitable
+
+{formatted_lit}"""
+
+            io_manager.print_section("LITERATURE VALIDATION - PROMPT", literature_prompt)
+            evaluation = send_ollama_request(literature_prompt, num_predict=VERDICT_NUM_PREDICT)
 
-        io_manager.print_section("LITERATURE VALIDATION - PROMPT", literature_prompt)
-        evaluation = send_ollama_request(literature_prompt)
+            if evaluation is None:
+                logging.error("Ollama request failed during literature validation")
+                return None
 
-        if evaluation is None:
-            logging.error("Ollama request failed during literature validation")
-            return None
+            io_manager.print_section("LITERATURE VALIDATION - RESPONSE", evaluation)
 
-        io_manager.print_section("LITERATURE VALIDATION - RESPONSE", evaluation)
+            match = VERDICT_NUMBER_OR_NONE_PATTERN.search(evaluation)
+            if not match:
+                logging.warning(f"Failed to parse literature verdict on attempt {attempt}")
+                continue
 
-        if "VERDICT: YES" in evaluation.upper():
-            logging.info(f"Suitable literature found (attempts: {attempt})")
+            if match.group(1).upper() == "NONE":
+                logging.debug(f"All {len(candidates)} excerpts rejected by LLM on attempt {attempt}")
+                continue
+
+            selection = int(match.group(1)) - 1
+            if selection < 0 or selection >= len(candidates):
+                logging.warning(f"Literature selection #{selection + 1} out of range on attempt {attempt}")
+                continue
+
+            literature, text = candidates[selection]
+            logging.info(f"Suitable literature found (attempts: {attempt}, excerpt #{selection + 1})")
             io_manager.save_book(text)
             return literature
-        else:
-            logging.debug(f"Literature rejected by LLM on attempt {attempt}")
 
     logging.error(f"Literature validation failed after {max_attempts} attempts")
     return None
@@ -107,10 +141,12 @@ def select_words(io_manager, literature, greeting_length=MESSAGE_MEAN_LEN):
     formatted_words = format_jabberwocky(generated_words)
     formatted_literature = format_literature(literature)
 
-    selection_prompt = f"""Select {select_count} of the {generate_count} randomly generated, Jabberwocky-style nonsense words. Try to make an interesting and varied selection which most reflects the writing style of the following literature excerpt.
+    # The excerpt leads the prompt, byte-identical to the album selection prompt that follows,
+    # so Ollama can reuse the cached prefill for it. Keep it first in both prompts.
+    selection_prompt = f"""{formatted_literature}
+
+Select {select_count} of the {generate_count} randomly generated, Jabberwocky-style nonsense words. Try to make an interesting and varied selection which most reflects the writing style of the literature excerpt above.
 
-{formatted_literature}
-    
 Avoid nonsense words which might sound too close to real words.
 
 {formatted_words}
@@ -127,10 +163,11 @@ Repond with your chosen words only and no other text. Transcribe exactly."""
     io_manager.print_section("WORD SELECTION - RESPONSE", selection_response)
 
     # Parse response: extract words (one per line, strip whitespace)
+    generated_set = set(generated_words)
     selected_words = []
     for line in selection_response.strip().split('\n'):
         word = line.strip()
-        if word and word in generated_words:
+        if word and word in generated_set:
             selected_words.append(word)
         elif word:
             logging.debug(f"Ignoring invalid word from LLM: '{word}'")
@@ -145,20 +182,22 @@ Repond with your chosen words only and no other text. Transcribe exactly."""
     literature['jabberwocky'] = selected_words
 
 
-def select_album(io_manager, literature):
+def select_album(io_manager, literature, albums=None):
     """
     Fetch 5 random albums and select the best pairing with literature using LLM.
 
     Args:
         io_manager: IOManager instance for output
         literature: Literature excerpt dict with info, or None if literature unavailable
+        albums: Optional prefetched album list from get_navidrome_albums() (fetched here if None)
 
     Returns:
         dict: Selected album with 'id', 'name', 'artist', 'year', 'genres' keys, or None if Navidrome unavailable
     """
     logging.info("Starting album selection")
 
-    albums = get_navidrome_albums(count=5)
+    if albums is None:
+        albums = get_navidrome_albums(count=5)
 
     # Graceful degradation: proceed without album data
     if not albums:
@@ -170,27 +209,39 @@ def select_album(io_manager, literature):
     # Adapt prompt based on literature availability
     if literature:
         formatted_literature = format_literature(literature)
-        album_prompt = f"""Please select one and only one of the following albums which would pair most interestingly with the selected literary excerpt, whether by contrast or by complement.
+        # Excerpt first: shares its cached prefill with the word selection prompt
+        album_prompt = f"""{formatted_literature}
 
-{formatted_albums}
+Please select one and only one of the following albums which would pair most interestingly with the literary excerpt above, whether by contrast or by complement.
 
-{formatted_literature}
+{formatted_albums}
 
-Respond in the following format exactly:
-REASONING: Two or three sentences considering different options before deciding on the best choice.
-VERDICT: [number only] (just the number 1-5, nothing else)"""
+Respond with a JSON object with the following fields:
+reasoning: Two or three sentences considering different options before deciding on the best choice.
+verdict: The number of the chosen album (1-{len(albums)})"""
     else:
         # Select album without literature context
         album_prompt = f"""Please select one and only one of the following albums which would be most interesting for a morning wake-up greeting.
 
 {formatted_albums}
 
-Respond in the following format exactly:
-REASONING: Two or three sentences considering different options before deciding on the best choice.
-VERDICT: [number only] (just the number 1-5, nothing else)"""
+Respond with a JSON object with the following fields:
+reasoning: Two or three sentences considering different options before deciding on the best choice.
+verdict: The number of the chosen album (1-{len(albums)})"""
+
+    # Constrain the reply to this schema so the verdict always parses
+    # (reasoning comes first so the model still thinks before choosing)
+    verdict_schema = {
+        "type": "object",
+        "properties": {
+            "reasoning": {"type": "string"},
+            "verdict": {"type": "integer", "minimum": 1, "maximum": len(albums)}
+        },
+        "required": ["reasoning", "verdict"]
+    }
 
     io_manager.print_section("ALBUM SELECTION - PROMPT", album_prompt)
-    evaluation = send_ollama_request(album_prompt)
+    evaluation = send_ollama_request(album_prompt, num_predict=VERDICT_NUM_PREDICT, json_schema=verdict_schema)
 
     if evaluation is None:
         logging.error("Ollama request failed during album selection")
@@ -198,18 +249,21 @@ VERDICT: [number only] (just the number 1-5, nothing else)"""
 
     io_manager.print_section("ALBUM SELECTION - RESPONSE", evaluation)
 
-    # Parse LLM verdict using regex
-    match = re.search(r'VERDICT:\s*(\d+)', evaluation)
-    if match:
-        selection = int(match.group(1)) - 1
+    # Parse LLM verdict from the structured reply
+    try:
+        selection = int(fastjson.loads(evaluation)['verdict']) - 1
+    except (ValueError, KeyError, TypeError):
+        selection = None
+
+    if selection is not None:
         if selection < 0 or selection >= len(albums):
             logging.warning(f"Album selection #{selection + 1} out of range, using random fallback")
-            selection = random.randint(0, 4)
+            selection = random.randrange(len(albums))
         else:
             logging.info(f"Selected album #{selection + 1}: '{albums[selection]['name']}' by {albums[selection]['artist']}")
     else:
         logging.warning("Failed to parse album selection, using random fallback")
-        selection = random.randint(0, 4)
+        selection = random.randrange(len(albums))
         logging.debug(f"Random fallback selected album #{selection + 1}")
 
     return albums[selection]
@@ -231,7 +285,7 @@ def analyze_album_art(io_manager, album):
         logging.warning("No album available, skipping art analysis")
         return
 
-    album_details = get_album_details(album['id'])
+    album_details = get_album_details(album['id'], album.get('coverart_id'))
 
     # Graceful degradation: handle Navidrome failures during detail fetch
     if not album_details:
@@ -248,8 +302,7 @@ def analyze_album_art(io_manager, album):
         return
 
     # Save cover art to file
-    coverart_bytes = base64.b64decode(album_details['coverart'])
-    io_manager.save_coverart(coverart_bytes)
+    io_manager.save_coverart(album_details['coverart'])
 
     art_prompt = """Provide a detailed, factual description of the provided album cover art. Use three to five bullet points.
 
@@ -267,6 +320,24 @@ Respond with only the description, no other text. Use markdown bullet points."""
         logging.info("Album art analysis complete")
 
 
+@functools.lru_cache(maxsize=None)
+def _lognormal_params(mean_len, q1_len):
+    """
+    Derive lognormal parameters from the configured length targets.
+
+    Cached on the arguments, so config overrides applied after import are
+    still picked up.
+
+    Args:
+        mean_len: Target mean greeting length in words
+        q1_len: Target first-quartile greeting length in words
+
+    Returns:
+        tuple: (mu, sigma) for random.lognormvariate
+    """
+    return math.log(mean_len), math.log(mean_len/q1_len)
+
+
 def calculate_greeting_length():
     """
     Calculate target greeting length using lognormal distribution.
@@ -277,8 +348,7 @@ def calculate_greeting_length():
     Returns:
         int: Target greeting length in words
     """
-    mu = math.log(MESSAGE_MEAN_LEN)
-    sigma = math.log(MESSAGE_MEAN_LEN/MESSAGE_Q1_LEN)
+    mu, sigma = _lognormal_params(MESSAGE_MEAN_LEN, MESSAGE_Q1_LEN)
     logging.debug(f"Lognormal with mu={mu:.2f}, sigma={sigma:.2f}")
 
     length = int(random.lognormvariate(mu, sigma))
@@ -301,7 +371,8 @@ def synthesize_materials(io_manager, weather, literature, album, greeting_length
         album: Album dict with details
 
     Returns:
-        str: Final daily greeting message
+        str: Final daily greeting message, or None if the request failed, was
+            truncated, or the response had no GREETING: section
     """
     # Calculate target greeting length
     length = greeting_length
@@ -370,26 +441,32 @@ GREETING:
 (The final generated greeting. Avoid extraneous punctuation such as surrounding quotations)"""
     
     io_manager.print_section("SYNTHESIS - PROMPT", synthesis_prompt)
-    greeting = send_ollama_request(synthesis_prompt)
+    # Cap output only as a runaway guard: generous reasoning allowance plus ~2 tokens per
+    # word of the longest allowed greeting. A truncated response counts as a failure,
+    # since the cut may fall before or inside the GREETING section.
+    num_predict = SYNTHESIS_REASONING_TOKENS + 2 * length_bounds[1]
+    greeting = send_ollama_request(synthesis_prompt, long_context=True, num_predict=num_predict,
+                                   allow_truncated=False)
 
     if greeting is None:
-        logging.error("Ollama request failed during synthesis")
+        logging.error("Ollama request failed or was truncated during synthesis")
         return None
 
     io_manager.print_section("SYNTHESIS - RESPONSE", greeting)
 
     # Extract only the GREETING section from the response
-    if "FORMATTED:" in greeting:
-        # Find the GREETING: marker and extract everything after it
-        greeting_start = greeting.find("FORMATTED:")
-        final_greeting = greeting[greeting_start + len("FORMATTED:"):].strip()
+    markers = list(GREETING_MARKER_PATTERN.finditer(greeting))
+    if markers:
+        # Take everything after the last GREETING: header (earlier ones may be in the reasoning)
+        final_greeting = greeting[markers[-1].end():].strip()
         # Remove surrounding quotes if present
         if final_greeting.startswith('"') and final_greeting.endswith('"'):
             final_greeting = final_greeting[1:-1]
         logging.debug(f"Extracted greeting ({len(final_greeting.split())} words)")
     else:
-        logging.warning("Could not find GREETING: marker in synthesis response, using full response")
-        final_greeting = greeting.strip()
+        # Never fall back to the full response: it is reasoning text, not a greeting to speak
+        logging.error("Could not find GREETING: marker in synthesis response")
+        return None
 
     logging.info("Synthesis layer complete")
 
@@ -0,0 +1,50 @@
+"""
+HTTP Session for Daily Greeting Generator
+
+Provides shared requests sessions so repeated calls to the same host
+(weather.gov, Gutendex, Navidrome, Ollama) reuse pooled keep-alive connections
+instead of paying a fresh TCP/TLS handshake per request.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Request timeouts as (connect, read) seconds; read applies between received bytes
+DEFAULT_TIMEOUT = (3.05, 10)
+OLLAMA_TIMEOUT = (3.05, 300)  # Model load plus non-streamed generation can take minutes
+
+# Shared session with connection pooling for all outbound API calls
+SESSION = requests.Session()
+
+# Retry transient connection errors and 5xx responses with backoff (0.3s, 0.6s, 1.2s).
+# raise_on_status=False hands the final error response back so callers still see its status code.
+_retry = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=("GET", "POST"),
+    raise_on_status=False
+)
+
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=_retry)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# Separate session for Ollama /api/generate POSTs. Generation is slow and not
+# idempotent, so a read error (e.g. a stalled stream hitting the 300s read timeout)
+# must not re-send the request: only connection failures and 5xx replies are retried.
+OLLAMA_SESSION = requests.Session()
+
+_ollama_retry = Retry(
+    total=3,
+    read=False,
+    backoff_factor=0.3,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=("POST",),
+    raise_on_status=False
+)
+
+_ollama_adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=_ollama_retry)
+OLLAMA_SESSION.mount("https://", _ollama_adapter)
+OLLAMA_SESSION.mount("http://", _ollama_adapter)
@@ -4,17 +4,48 @@ Text-to-Speech Module for Daily Greeting Generator
 Handles audio rendering using Coqui TTS and delivery to playback server.
 """
 
+import contextlib
+import functools
 import logging
 import time
 import random
-import torch
 import requests
 from pathlib import Path
-from TTS.api import TTS
+
+# torch and TTS are imported inside the synthesis functions: they take
+# seconds to import, and config loading, playback delivery, and runs that
+# abort before synthesis never need them.
 
 # Playback server address
 SERVER_ADDR = "http://192.168.1.36:7000"
 
+# Keep-alive session for playback uploads. Kept separate from the shared
+# API session because send_to_playback_server does its own retries with
+# backoff, and stacking the shared adapter's retries on top would multiply attempts.
+PLAYBACK_SESSION = requests.Session()
+
+# Coqui model identifier
+TTS_MODEL = "tts_models/multilingual/multi-dataset/xtts_v2"
+HALF_PRECISION = False  # Run CUDA synthesis under FP16 autocast (less VRAM/bandwidth; check audio quality)
+ALLOW_CPU = True  # Fall back to (very slow, ~2 GB RAM) CPU synthesis when CUDA is unavailable
+
+
+@functools.lru_cache(maxsize=2)
+def _load_tts(device):
+    """
+    Load the XTTS-v2 model onto a device, reusing it on later calls.
+
+    Args:
+        device: Torch device name ("cuda" or "cpu")
+
+    Returns:
+        TTS: Loaded Coqui TTS instance
+    """
+    from TTS.api import TTS
+
+    logging.info(f"Loading {TTS_MODEL} onto {device}")
+    return TTS(TTS_MODEL).to(device)
+
 
 def synthesize_greeting(text, io_manager):
     """
@@ -33,6 +64,8 @@ def synthesize_greeting(text, io_manager):
     output_path = io_manager.data_dir / f"greeting_{io_manager.date_str}.wav"
 
     try:
+        import torch
+
         logging.info("Initializing Coqui TTS with XTTS-v2 model")
 
         # Initialize TTS with GPU if available
@@ -42,22 +75,36 @@ def synthesize_greeting(text, io_manager):
         if device == "cuda":
             gpu_name = torch.cuda.get_device_name(0)
             logging.info(f"GPU detected: {gpu_name}")
-
-        tts = TTS("tts_models/multilingual/multi-dataset/xtts_v2").to(device)
-        logging.debug(f"Speaker options: {tts.speakers}")
+        elif not ALLOW_CPU:
+            # Bail out before loading the XTTS weights at all
+            logging.error("CUDA unavailable and CPU synthesis disabled, skipping TTS")
+            return None
+
+        tts = _load_tts(device)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(f"Speaker options: {tts.speakers}")
         speaker = random.choice(tts.speakers)
         logging.info(f"Selected random speaker: {speaker}")
 
         logging.info(f"Synthesizing greeting to {output_path}")
         start_time = time.time()
 
+        # Optional mixed precision; the weights themselves stay FP32. With
+        # half_precision off, synthesis runs in the default context as before.
+        if HALF_PRECISION and device == "cuda":
+            logging.info("Using FP16 autocast for synthesis")
+            precision = torch.autocast("cuda", dtype=torch.float16)
+        else:
+            precision = contextlib.nullcontext()
+
         # Synthesize with voice cloning (pass all clips as list)
-        tts.tts_to_file(
-            text=text,
-            speaker=speaker,
-            language="en",
-            file_path=str(output_path)
-        )
+        with precision:
+            tts.tts_to_file(
+                text=text,
+                speaker=speaker,
+                language="en",
+                file_path=str(output_path)
+            )
 
         elapsed = time.time() - start_time
         logging.info(f"TTS synthesis complete ({elapsed:.2f}s)")
@@ -109,7 +156,7 @@ def send_to_playback_server(audio_path, album, max_retries=5):
                 # Send audio file and song URLs as multipart form data
                 files = {'audio': f}
                 data = {'song_urls': '\n'.join(song_urls)}
-                response = requests.post(
+                response = PLAYBACK_SESSION.post(
                     endpoint,
                     files=files,
                     data=data,
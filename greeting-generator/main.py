@@ -12,15 +12,20 @@ Stages:
 5. Synthesis layer
 6. Composition layer
 7. TTS synthesis
+
+Stage results already saved for today are reused, so a rerun after a
+late-stage failure skips the fetches and LLM calls that succeeded.
+Pass --force to regenerate everything.
 """
 
-import json
+import argparse
 import logging
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 from generator.config import load_config, apply_config
 from generator.io_manager import IOManager, setup_logging
-from generator.data_sources import get_weather_data
+from generator.data_sources import get_weather_data, get_navidrome_albums
 from generator.pipeline import (
     validate_literature,
     select_words,
@@ -29,13 +34,18 @@ from generator.pipeline import (
     synthesize_materials,
     calculate_greeting_length
 )
-from generator.llm import unload_all_models
+from generator.llm import MODEL, load_model, unload_all_models
 from generator.tts import synthesize_greeting, send_to_playback_server
 
 
 def main():
     """Run the full pipeline iteration."""
 
+    parser = argparse.ArgumentParser(description="Generate and deliver today's greeting.")
+    parser.add_argument("--force", action="store_true",
+                        help="regenerate every stage instead of reusing today's saved results")
+    args = parser.parse_args()
+
     # Setup basic logging first (will be reconfigured after IOManager init)
     logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
 
@@ -53,48 +63,75 @@ def main():
 
         greeting_length = calculate_greeting_length()
 
+        # Resume from stage results already saved today (unless forced to start over)
+        saved = {} if args.force else io_manager.load_data_file(missing_ok=True) or {}
+        weather = saved.get('weather')
+        literature = saved.get('literature')
+        album = saved.get('album')
+        greeting = saved.get('greeting')
+
+        reused = [key for key in ('weather', 'literature', 'album', 'greeting') if saved.get(key)]
+        if reused:
+            logging.info(f"Reusing saved results: {', '.join(reused)}")
+
         try:
-            # Stage 1: Weather data
-            logging.info("Stage 1: Weather data")
-            weather = get_weather_data()
-
-            if not weather:
-                logging.warning("Weather data unavailable, proceeding with degraded greeting")
-
-            logging.debug(f"Weather data: {json.dumps(weather, indent=2)}")
-            io_manager.update_data_file(weather=weather)
-
-            # Stage 2: Literature validation
-            logging.info("Stage 2: Literature validation")
-            literature = validate_literature(io_manager, max_attempts=5)
-            if not literature:
-                logging.warning("Literature unavailable after 5 attempts, proceeding without literary data")
-            select_words(io_manager, literature, greeting_length)
-            io_manager.update_data_file(literature=literature)
-
-            # Stage 3: Album selection
-            logging.info("Stage 3: Album selection")
-            album = select_album(io_manager, literature)
-
-            if not album:
-                logging.warning("Album selection unavailable, proceeding without music data")
-
-            # Stage 4: Album art analysis
-            logging.info("Stage 4: Album art analysis")
-            analyze_album_art(io_manager, album)
-            io_manager.update_data_file(album=album)
-
-            # Stage 5: Synthesis layer
-            logging.info("Stage 5: Synthesis")
-            greeting = synthesize_materials(io_manager, weather, literature, album, greeting_length)
-
-            if not greeting:
-                logging.error("Pipeline aborted: Synthesis failed (Ollama unavailable)")
-                return
-
-            io_manager.save_greeting(greeting)
-            io_manager.update_data_file(greeting=greeting)
-            logging.info("Greeting generated and saved")
+            if greeting:
+                logging.info("Stages 1-5: Reusing saved greeting")
+            else:
+                # Stage 1: Weather data (fetched in the background, independent of literature)
+                logging.info("Stage 1: Weather data")
+                with ThreadPoolExecutor(max_workers=3) as executor:
+                    # Load the text model while the first literature candidates download
+                    executor.submit(load_model, MODEL)
+                    weather_future = None if weather else executor.submit(get_weather_data)
+                    # Album candidates don't depend on literature either, so prefetch them too
+                    albums_future = None if album else executor.submit(get_navidrome_albums, 5)
+
+                    # Stage 2: Literature validation (overlaps the weather and album fetches)
+                    logging.info("Stage 2: Literature validation")
+                    new_literature = not literature
+                    if new_literature:
+                        literature = validate_literature(io_manager, max_attempts=5)
+
+                    if weather_future:
+                        weather = weather_future.result()
+                    albums = albums_future.result() if albums_future else None
+
+                if not weather:
+                    logging.warning("Weather data unavailable, proceeding with degraded greeting")
+
+                io_manager.update_data_file(weather=weather)
+
+                if new_literature:
+                    if not literature:
+                        logging.warning("Literature unavailable after 5 attempts, proceeding without literary data")
+                    select_words(io_manager, literature, greeting_length)
+                    io_manager.update_data_file(literature=literature)
+
+                if not album:
+                    # Stage 3: Album selection
+                    logging.info("Stage 3: Album selection")
+                    album = select_album(io_manager, literature, albums)
+
+                    if not album:
+                        logging.warning("Album selection unavailable, proceeding without music data")
+
+                    # Stage 4: Album art analysis
+                    logging.info("Stage 4: Album art analysis")
+                    analyze_album_art(io_manager, album)
+                    io_manager.update_data_file(album=album)
+
+                # Stage 5: Synthesis layer
+                logging.info("Stage 5: Synthesis")
+                greeting = synthesize_materials(io_manager, weather, literature, album, greeting_length)
+
+                if not greeting:
+                    logging.error("Pipeline aborted: Synthesis failed (Ollama unavailable or no usable GREETING section)")
+                    return
+
+                io_manager.save_greeting(greeting)
+                io_manager.update_data_file(greeting=greeting)
+                logging.info("Greeting generated and saved")
 
             # Stage 6: TTS synthesis
             logging.info("Stage 6: TTS synthesis")
@@ -0,0 +1,61 @@
+"""
+Shared Setup for Stage Test Scripts
+
+Puts the project root on sys.path and performs the configuration, I/O
+manager, and logging setup common to every test_*.py script. Import this
+module before any generator modules.
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(BASE_DIR))
+
+from generator.config import load_config, apply_config
+from generator.io_manager import IOManager, setup_logging
+
+
+def setup_test(date_str):
+    """
+    Apply config overrides and set up I/O and debug logging for a test run.
+
+    Args:
+        date_str: Date string (YYYY-MM-DD) of the run directory to load from
+
+    Returns:
+        IOManager: I/O manager for the dated run directory
+    """
+    # Setup basic logging first
+    logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
+
+    # Load configuration overrides
+    config = load_config(BASE_DIR)
+    apply_config(config)
+
+    # Initialize I/O manager and full logging
+    io_manager = IOManager(BASE_DIR, date_str=date_str)
+    setup_logging(io_manager, logging.DEBUG)
+
+    return io_manager
+
+
+def load_test_data(io_manager, label):
+    """
+    Load the stored data file for a test run.
+
+    Args:
+        io_manager: IOManager from setup_test()
+        label: Test name used as the prefix of the abort message
+
+    Returns:
+        dict: Stored pipeline data, or None if it could not be loaded
+    """
+    data = io_manager.load_data_file()
+    if not data:
+        logging.error(f"{label} aborted: Could not load data file")
+        return None
+    return data
@@ -10,16 +10,10 @@ Usage:
     python test_album.py
 """
 
-import sys
 import json
 import logging
-from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from generator.config import load_config, apply_config
-from generator.io_manager import IOManager, setup_logging
+from _harness import setup_test, load_test_data
 from generator.data_sources import get_album_details
 
 # Date to load data from
@@ -29,27 +23,15 @@ DATE = "2025-10-26"
 def main():
     """Run album details fetch test using stored album ID."""
 
-    # Setup basic logging first
-    logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
-
-    base_dir = Path(__file__).parent.parent
-
-    # Load configuration overrides
-    config = load_config(base_dir)
-    apply_config(config)
-
-    # Initialize I/O manager and full logging
-    io_manager = IOManager(base_dir, date_str=DATE)
-    setup_logging(io_manager, logging.DEBUG)
+    io_manager = setup_test(DATE)
 
     logging.info("=== ALBUM DETAILS TEST START ===")
     logging.info(f"Loading data from {io_manager.date_str}")
 
     try:
         # Load stored data
-        data = io_manager.load_data_file()
+        data = load_test_data(io_manager, "Album test")
         if not data:
-            logging.error("Album test aborted: Could not load data file")
             return
 
         # Extract album data
@@ -72,7 +54,10 @@ def main():
             logging.error("Album details fetch failed")
             return
 
-        # Display results as JSON
+        # Display results as JSON (cover art is raw image bytes, so summarize it)
+        coverart = album_details.get('coverart')
+        if coverart is not None:
+            album_details = {**album_details, 'coverart': f"<{len(coverart)} bytes>"}
         print(json.dumps(album_details, indent=2))
 
         logging.info("=== ALBUM DETAILS TEST COMPLETE ===")
@@ -10,15 +10,9 @@ Usage:
     python test_image.py
 """
 
-import sys
 import logging
-from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from generator.config import load_config, apply_config
-from generator.io_manager import IOManager, setup_logging
+from _harness import setup_test, load_test_data
 from generator.pipeline import analyze_album_art
 
 # Date to load data from
@@ -28,27 +22,15 @@ DATE = "2025-10-26"
 def main():
     """Run album art analysis test using stored album data."""
 
-    # Setup basic logging first
-    logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
-
-    base_dir = Path(__file__).parent.parent
-
-    # Load configuration overrides
-    config = load_config(base_dir)
-    apply_config(config)
-
-    # Initialize I/O manager and full logging
-    io_manager = IOManager(base_dir, date_str=DATE)
-    setup_logging(io_manager, logging.DEBUG)
+    io_manager = setup_test(DATE)
 
     logging.info("=== ALBUM ART ANALYSIS TEST START ===")
     logging.info(f"Loading data from {io_manager.date_str}")
 
     try:
         # Load stored data
-        data = io_manager.load_data_file()
+        data = load_test_data(io_manager, "Test")
         if not data:
-            logging.error("Test aborted: Could not load data file")
             return
 
         # Extract album data
@@ -10,15 +10,9 @@ Usage:
     python test_llm.py
 """
 
-import sys
 import logging
-from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from generator.config import load_config, apply_config
-from generator.io_manager import IOManager, setup_logging
+from _harness import setup_test, load_test_data
 from generator.pipeline import synthesize_materials
 
 # Date to load data from
@@ -28,27 +22,15 @@ DATE = "2025-10-26"
 def main():
     """Run the test pipeline using stored data."""
 
-    # Setup basic logging first
-    logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
-
-    base_dir = Path(__file__).parent.parent
-
-    # Load configuration overrides
-    config = load_config(base_dir)
-    apply_config(config)
-
-    # Initialize I/O manager and full logging
-    io_manager = IOManager(base_dir, date_str=DATE)
-    setup_logging(io_manager, logging.DEBUG)
+    io_manager = setup_test(DATE)
 
     logging.info("=== TEST PIPELINE START ===")
     logging.info(f"Loading data from {io_manager.date_str}")
 
     try:
         # Load stored data
-        data = io_manager.load_data_file()
+        data = load_test_data(io_manager, "Test pipeline")
         if not data:
-            logging.error("Test pipeline aborted: Could not load data file")
             return
 
         # Extract stored data
@@ -66,6 +48,7 @@ def main():
         if greeting:
             io_manager.save_greeting(greeting)
             io_manager.update_data_file(greeting=greeting)
+            io_manager.flush_data_file()
             logging.info("Greeting generated and saved")
 
         logging.info("=== TEST PIPELINE COMPLETE ===")
@@ -7,67 +7,91 @@ to audio using Coqui XTTS-v2. Useful for testing TTS changes without re-running
 the full pipeline.
 
 Usage:
-    python test_tts.py
+    python test_tts.py [--watch]
 """
 
-import sys
+import argparse
 import logging
-from pathlib import Path
+from datetime import datetime
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from generator.config import load_config, apply_config
-from generator.io_manager import IOManager, setup_logging
+from _harness import BASE_DIR, setup_test, load_test_data
+from generator.io_manager import IOManager
 from generator.tts import synthesize_greeting
 
 # Date to load data from
 DATE = "2025-10-26"
 
 
-def main():
-    """Run TTS synthesis test using stored greeting text."""
+def run_tts(io_manager):
+    """
+    Synthesize the stored greeting for one date and record the audio path.
+
+    Args:
+        io_manager: IOManager for the date to load the greeting from
+    """
+    logging.info(f"Loading data from {io_manager.date_str}")
+
+    # Load stored data
+    data = load_test_data(io_manager, "TTS test")
+    if not data:
+        return
+
+    # Extract greeting text
+    greeting = data.get('greeting')
+    if not greeting:
+        logging.error("TTS test aborted: No greeting found in data file")
+        return
 
-    # Setup basic logging first
-    logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
+    logging.info(f"Loaded greeting ({len(greeting)} chars)")
 
-    base_dir = Path(__file__).parent.parent
+    # Synthesize to audio
+    result = synthesize_greeting(greeting, io_manager)
 
-    # Load configuration overrides
-    config = load_config(base_dir)
-    apply_config(config)
+    if result:
+        logging.info(f"Audio saved successfully")
+        # Update data file with audio path
+        io_manager.update_data_file(audio_path=str(result))
+        io_manager.flush_data_file()
+    else:
+        logging.error("TTS synthesis failed")
 
-    # Initialize I/O manager and full logging
-    io_manager = IOManager(base_dir, date_str=DATE)
-    setup_logging(io_manager, logging.DEBUG)
+
+def main():
+    """Run TTS synthesis test using stored greeting text."""
+
+    parser = argparse.ArgumentParser(description="Synthesize a stored greeting with XTTS-v2.")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep the model loaded and re-synthesize on demand after the first run")
+    args = parser.parse_args()
+
+    io_manager = setup_test(DATE)
 
     logging.info("=== TTS TEST START ===")
-    logging.info(f"Loading data from {io_manager.date_str}")
 
     try:
-        # Load stored data
-        data = io_manager.load_data_file()
-        if not data:
-            logging.error("TTS test aborted: Could not load data file")
-            return
-
-        # Extract greeting text
-        greeting = data.get('greeting')
-        if not greeting:
-            logging.error("TTS test aborted: No greeting found in data file")
-            return
-
-        logging.info(f"Loaded greeting ({len(greeting)} chars)")
-
-        # Synthesize to audio
-        result = synthesize_greeting(greeting, io_manager)
-
-        if result:
-            logging.info(f"Audio saved successfully")
-            # Update data file with audio path
-            io_manager.update_data_file(audio_path=str(result))
-        else:
-            logging.error("TTS synthesis failed")
+        run_tts(io_manager)
+
+        # Watch mode: the XTTS model stays loaded in this process, so each
+        # repeat pays only for synthesis (edit the greeting in the data file between runs)
+        while args.watch:
+            try:
+                date_str = input("Date to synthesize (Enter repeats, q quits): ").strip()
+            except EOFError:
+                break
+            if date_str.lower() == 'q':
+                break
+
+            # Reject malformed dates before they become a run directory name
+            if date_str:
+                try:
+                    datetime.strptime(date_str, "%Y-%m-%d")
+                except ValueError:
+                    logging.warning(f"Invalid date '{date_str}', expected YYYY-MM-DD")
+                    continue
+
+            # Fresh IOManager so the data file is re-read, picking up edits
+            io_manager = IOManager(BASE_DIR, date_str=date_str or io_manager.date_str)
+            run_tts(io_manager)
 
         logging.info("=== TTS TEST COMPLETE ===")
 
@@ -43,9 +43,12 @@ fi
 
 log "INFO: Past sunrise time, playing greeting"
 
-# Mark as played by adding 1 day (86400 seconds) to sunrise time
+# Mark as played by adding 1 day (86400 seconds) to sunrise time.
+# Write, sync, then rename so a crash can't lose the update and replay the greeting
 NEW_EPOCH=$((SUNRISE_EPOCH + 86400))
-echo "$NEW_EPOCH" > "$SCHEDULE_FILE"
+echo "$NEW_EPOCH" > "$SCHEDULE_FILE.$$"
+sync "$SCHEDULE_FILE.$$"
+mv -f "$SCHEDULE_FILE.$$" "$SCHEDULE_FILE"
 
 log "INFO: Next playback time scheduled"
 
@@ -7,14 +7,24 @@ Calculates tomorrow's sunrise time for the checker script.
 Runs as a systemd service on the music playback server.
 """
 
+import os
 import logging
+import logging.handlers
+import functools
 import configparser
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
 from flask import Flask, request, jsonify
+from flask.logging import default_handler
+from werkzeug.exceptions import RequestEntityTooLarge
 from astral import LocationInfo
 from astral.sun import sun
 
+try:
+    from waitress import serve  # Production WSGI server (threaded, keep-alive)
+except ImportError:
+    serve = None
+
 # Configuration - paths relative to script location
 BASE_DIR = Path(__file__).parent
 DATA_DIR = BASE_DIR / "data"
@@ -29,28 +39,74 @@ DEFAULT_PORT = 7000
 DEFAULT_LAT = 0.0
 DEFAULT_LON = 0.0
 DEFAULT_OFFSET = 0
+UPLOAD_CHUNK_SIZE = 64 * 1024  # Bytes per copy when writing the received audio to disk
+MAX_UPLOAD_BYTES = 64 * 1024 * 1024  # Reject uploads larger than this (a greeting WAV is a few MB)
+
+# Parsed config, reused until config.ini's modification time changes
+_CONFIG_CACHE = {'mtime': None, 'data': None}
 
 app = Flask(__name__)
+app.config['MAX_CONTENT_LENGTH'] = MAX_UPLOAD_BYTES
 
 # Setup logging using Flask's app logger
 LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
 
 # Configure Flask's logger to write to our log file
-file_handler = logging.FileHandler(LOG_FILE)
+file_handler = logging.FileHandler(LOG_FILE, delay=True)
 file_handler.setLevel(logging.INFO)
 file_handler.setFormatter(logging.Formatter(
     '[%(asctime)s] %(levelname)s: %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
 ))
 
-app.logger.addHandler(file_handler)
+# Buffer a request's log lines into one write; flushed at the end of every
+# request (see flush_log) so nothing sits in memory between requests
+buffered_handler = logging.handlers.MemoryHandler(
+    capacity=64,
+    flushLevel=logging.WARNING,
+    target=file_handler
+)
+
+app.logger.addHandler(buffered_handler)
 app.logger.setLevel(logging.INFO)
 
+# Under systemd (INVOCATION_ID is set) stderr is appended to the same log
+# file by greeting.service, so Flask's stderr handler would write every line twice
+if os.getenv('INVOCATION_ID') is not None:
+    app.logger.removeHandler(default_handler)
+
 
 def load_config():
     """
     Load playback configuration from INI file.
 
+    The parsed result is cached and only re-read when the file's
+    modification time changes, so repeated POSTs skip the INI parse.
+
+    Returns:
+        dict: Configuration with 'port', 'lat', 'lon', 'offset_minutes' keys
+    """
+    try:
+        mtime = CONFIG_FILE.stat().st_mtime
+    except FileNotFoundError:
+        mtime = None
+
+    if _CONFIG_CACHE['data'] is not None and mtime == _CONFIG_CACHE['mtime']:
+        return _CONFIG_CACHE['data']
+
+    config = _parse_config(mtime is not None)
+    _CONFIG_CACHE['mtime'] = mtime
+    _CONFIG_CACHE['data'] = config
+    return config
+
+
+def _parse_config(file_exists):
+    """
+    Parse config.ini over the built-in defaults.
+
+    Args:
+        file_exists: Whether CONFIG_FILE was found
+
     Returns:
         dict: Configuration with 'port', 'lat', 'lon', 'offset_minutes' keys
     """
@@ -61,7 +117,7 @@ def load_config():
         'offset_minutes': DEFAULT_OFFSET
     }
 
-    if not CONFIG_FILE.exists():
+    if not file_exists:
         app.logger.warning(f"Config file not found: {CONFIG_FILE}, using defaults")
         return config
 
@@ -82,7 +138,8 @@ def load_config():
         if 'playback' in parser:
             config['offset_minutes'] = parser['playback'].getint('offset_minutes', DEFAULT_OFFSET)
 
-        app.logger.debug(f"Loaded config: {config}")
+        # Lazy %-formatting: the logger runs at INFO, so the dict repr is usually skipped
+        app.logger.debug("Loaded config: %s", config)
         return config
 
     except Exception as e:
@@ -90,6 +147,25 @@ def load_config():
         return config
 
 
+@functools.lru_cache(maxsize=8)
+def _sunrise_for(lat, lon, day):
+    """
+    Calculate the UTC sunrise for a location and calendar date.
+
+    Cached since the result is fixed for a given location and day.
+
+    Args:
+        lat: Latitude in degrees
+        lon: Longitude in degrees
+        day: datetime.date to calculate sunrise for
+
+    Returns:
+        datetime: UTC-aware sunrise time
+    """
+    location = LocationInfo(latitude=lat, longitude=lon)
+    return sun(location.observer, date=day)['sunrise']
+
+
 def get_sunrise_time(config):
     """
     Calculate today's sunrise time with configured offset, then saves to a file for the checker script.
@@ -101,17 +177,12 @@ def get_sunrise_time(config):
         config: Configuration dict with lat, lon, offset_minutes
     """
     try:
-        location = LocationInfo(latitude=config['lat'], longitude=config['lon'])
-
         # Get current time in UTC (to match astral's UTC output)
         now_utc = datetime.now(timezone.utc)
 
-        # Calculate sunrise time for today
-        s = sun(location.observer, date=now_utc)
-        app.logger.info(f"Calculating sunrise for today ({now_utc.strftime('%Y-%m-%d')})")
-
         # Get the sunrise for today plus offset
-        sunrise = s['sunrise'] + timedelta(minutes=config['offset_minutes'])
+        app.logger.info(f"Calculating sunrise for today ({now_utc.strftime('%Y-%m-%d')})")
+        sunrise = _sunrise_for(config['lat'], config['lon'], now_utc.date()) + timedelta(minutes=config['offset_minutes'])
 
         # Compare full datetime objects (both are now UTC-aware)
         if sunrise < now_utc:
@@ -119,8 +190,7 @@ def get_sunrise_time(config):
             # Calculate tomorrow's sunrise
             tomorrow = now_utc + timedelta(days=1)
             app.logger.info(f"Calculating sunrise for tomorrow ({tomorrow.strftime('%Y-%m-%d')})")
-            s = sun(location.observer, date=tomorrow)
-            sunrise = s['sunrise'] + timedelta(minutes=config['offset_minutes'])
+            sunrise = _sunrise_for(config['lat'], config['lon'], tomorrow.date()) + timedelta(minutes=config['offset_minutes'])
 
         app.logger.info(f"Sunrise time calculated: {sunrise.strftime('%Y-%m-%d %H:%M:%S')} UTC")
 
@@ -131,10 +201,15 @@ def get_sunrise_time(config):
     try:
         sunrise_epoch = int(sunrise.timestamp())
 
-        with open(SCHEDULE_FILE, 'w') as f:
+        # Write to a synced temp file and rename so the checker never reads a partial schedule
+        tmp_path = SCHEDULE_FILE.with_name(SCHEDULE_FILE.name + '.tmp')
+        with open(tmp_path, 'w') as f:
             f.write(f"{sunrise_epoch}\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, SCHEDULE_FILE)
 
-        app.logger.debug(f"Sunrise time saved: {sunrise_epoch}")
+        app.logger.debug("Sunrise time saved: %s", sunrise_epoch)
 
     except Exception as e:
         app.logger.error(f"Error saving sunrise time: {e}")
@@ -166,8 +241,8 @@ def receive_greeting():
 
         audio_file = request.files['audio']
 
-        # Save audio file (overwrites previous)
-        audio_file.save(GREETING_FILE)
+        # Stream audio file to disk in large chunks (overwrites previous)
+        audio_file.save(GREETING_FILE, buffer_size=UPLOAD_CHUNK_SIZE)
         app.logger.info("Greeting audio received and saved")
 
         # Get and save song URLs if provided
@@ -176,7 +251,7 @@ def receive_greeting():
             with open(SONG_URLS_FILE, 'w') as f:
                 f.write(song_urls)
 
-            num_songs = len(song_urls.strip().split('\n'))
+            num_songs = song_urls.strip().count('\n') + 1
             app.logger.info(f"Saved {num_songs} song URLs")
         else:
             app.logger.warning("No song URLs provided")
@@ -187,6 +262,13 @@ def receive_greeting():
 
         return jsonify({'status': 'success'}), 200
 
+    except RequestEntityTooLarge:
+        app.logger.warning(f"Rejected upload larger than {MAX_UPLOAD_BYTES} bytes")
+        return jsonify({
+            'status': 'error',
+            'message': 'Upload too large'
+        }), 413
+
     except Exception as e:
         app.logger.exception(f"Error receiving greeting: {e}")
         return jsonify({
@@ -194,8 +276,20 @@ def receive_greeting():
             'message': str(e)
         }), 500
 
+@app.teardown_request
+def flush_log(exc):
+    """Write the request's buffered log lines to the log file."""
+    buffered_handler.flush()
+
+
 if __name__ == '__main__':
     config = load_config()
     port = config['port']
     app.logger.info(f"Starting Flask greeting receiver on port {port}")
-    app.run(host='0.0.0.0', port=port, use_reloader=False)
+    buffered_handler.flush()
+
+    if serve is not None:
+        serve(app, host='0.0.0.0', port=port, threads=4)
+    else:
+        # Werkzeug development server (waitress not installed)
+        app.run(host='0.0.0.0', port=port, use_reloader=False)
@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import os
 import random
 import subprocess
 from pathlib import Path
@@ -11,8 +12,10 @@ if not CHIME_DIR.exists():
     print(f"Directory {CHIME_DIR} does not exist")
     exit(1)
 
-# Get all audio files (adjust extensions as needed)
-chimes = list(CHIME_DIR.glob("*.wav"))  # or *.mp3, *.ogg, etc.
+# Get all audio files (adjust extensions as needed); a single scandir pass
+# reads the names straight from the directory entries
+with os.scandir(CHIME_DIR) as entries:
+    chimes = [Path(entry.path) for entry in entries if entry.name.endswith(".wav")]  # or .mp3, .ogg, etc.
 
 if not chimes:
     print(f"No audio files found in {CHIME_DIR}")